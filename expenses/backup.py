@@ -281,13 +281,20 @@ def list_backups() -> list[tuple[datetime, Path, int]]:
     return sorted(backups, key=lambda x: x[0], reverse=True)
 
 
-def get_backup_stats() -> dict[str, any]:
+def get_backup_stats(
+    backups: Optional[list[tuple[datetime, Path, int]]] = None,
+) -> dict[str, any]:
     """Get statistics about current backups.
 
+    Args:
+        backups: Result of list_backups(), if the caller already has it;
+            listed here otherwise
+
     Returns:
         Dictionary with backup statistics (count, total_size, oldest, newest)
     """
-    backups = list_backups()
+    if backups is None:
+        backups = list_backups()
 
     if not backups:
         return {
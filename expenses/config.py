@@ -15,6 +15,7 @@ MERCHANT_ALIASES_FILE: Path = CONFIG_DIR / "merchant_aliases.json"
 CATEGORY_TYPES_FILE: Path = CONFIG_DIR / "category_types.json"
 DEFAULT_CATEGORY_TYPES_FILE: Path = CONFIG_DIR / "default_category_types.json"
 TAG_SETTINGS_FILE: Path = CONFIG_DIR / "tag_settings.json"
+GEMINI_CACHE_FILE: Path = CONFIG_DIR / "gemini_cache.json"
 LOG_FILE: Path = CONFIG_DIR / "app.log"
 EXPORTS_DIR: Path = CONFIG_DIR / "exports"
 
@@ -25,6 +26,9 @@ PAYSLIP_SETTINGS_FILE: Path = CONFIG_DIR / "payslip_settings.json"
 # Optional runtime overrides (never hardcode a personal folder path)
 PAYSLIP_DIR = os.getenv("PAYSLIP_DIR")  # folder containing payslip PDFs
 PAYSLIP_PDF_PASSWORD = os.getenv("PAYSLIP_PDF_PASSWORD")  # optional PDF password
+GEMINI_CACHE_TTL = os.getenv("GEMINI_CACHE_TTL")  # seconds to reuse a suggestion
+GEMINI_CACHE_MAX_ENTRIES = os.getenv("GEMINI_CACHE_MAX_ENTRIES")  # default 5000
+GEMINI_PARALLEL = os.getenv("GEMINI_PARALLEL")  # concurrent Gemini requests (default 4)
 
 # TrueLayer API Configuration
 TRUELAYER_CLIENT_ID = os.getenv("TRUELAYER_CLIENT_ID")
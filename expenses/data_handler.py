@@ -1,10 +1,23 @@
+import concurrent.futures
+import copy
+import hashlib
 import logging
+import os
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 import json
 import importlib.resources
 import re
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterator, List, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
 
 from expenses.backup import create_auto_backup
 from expenses.gemini_utils import get_gemini_category_suggestions_for_merchants
@@ -29,6 +42,46 @@ from expenses.config import (
 # Global flag to track if corruption was detected (for TUI notification)
 _corruption_detected: Optional[str] = None
 
+# Plain decimal/scientific number, as left over after clean_amount's cleanup
+_NUMBER_PATTERN = r"^[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?$"
+
+# Content digest and on-disk signature of the last payload written per file,
+# used to skip rewriting files whose contents have not changed.
+_last_saved: Dict[Path, tuple] = {}
+
+# Last loaded transactions (all rows, after compatibility migrations) as
+# (path, signature, DataFrame); callers always get a copy.
+_transactions_cache: Optional[tuple] = None
+
+# Parsed JSON config files as {path: (signature, data)}; see _read_json_cached.
+_json_cache: Dict[Path, tuple] = {}
+
+# Parsed package default_categories.json, which can't change while running
+_package_default_categories: Optional[object] = None
+
+# Compiled merchant aliases as (alias items, matchers), reused while the
+# alias content is unchanged. See _compile_merchant_aliases.
+_alias_cache: Optional[tuple] = None
+
+# Runs auto-backups off the caller's thread; one worker keeps them ordered.
+# Callers must wait on the returned future before overwriting the data files.
+_backup_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="auto-backup"
+)
+
+# Characters that make an alias pattern a regex rather than a plain substring
+_REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()")
+
+# A {m}, {m,}, {,n} or {m,n} repeat; re reads any other "{" literally
+_REPEAT_QUANTIFIER = re.compile(r"\{(?:\d+(?:,\d*)?|,\d*)\}")
+
+# Non-ASCII letters that re.IGNORECASE matches against ASCII ones. Folding
+# them first makes `ascii_literal in _fold_merchant(name)` agree exactly
+# with a case-insensitive regex search for that literal.
+_ASCII_FOLD = str.maketrans(
+    {"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"}
+)
+
 
 # --- Helper Functions ---
 def _set_secure_permissions(file_path: Path) -> None:
@@ -66,16 +119,159 @@ def _ensure_secure_config_dir() -> None:
             )
 
 
+def _stat_signature(st: os.stat_result) -> tuple:
+    """Return the (inode, size, mtime_ns, ctime_ns) signature of a stat result.
+
+    ctime is included because restores (tar extraction, shutil.copy2) write
+    in place and reset mtime to the backed-up value; they can't reset ctime.
+    """
+    return (st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+
+
+def _file_signature(file_path: Path) -> Optional[tuple]:
+    """Return the _stat_signature of a file, or None if it can't be stat'ed."""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return _stat_signature(st)
+
+
+def _is_unchanged(file_path: Path, digest: Optional[str]) -> bool:
+    """Check whether file_path still holds the payload we last wrote with this digest.
+
+    The file signature is compared too, so a file replaced behind our back
+    (e.g. by a backup restore) is always rewritten.
+    """
+    if digest is None:
+        return False
+    return _last_saved.get(file_path) == (digest, _file_signature(file_path))
+
+
+def _remember_saved(file_path: Path, digest: Optional[str]) -> None:
+    """Record the digest and resulting file signature of a completed write."""
+    if digest is None:
+        _last_saved.pop(file_path, None)
+    else:
+        _last_saved[file_path] = (digest, _file_signature(file_path))
+
+
+def _atomic_write(file_path: Path, write_fn: Callable[[Path], None]) -> None:
+    """Write a file via a temporary sibling and atomically move it into place.
+
+    A crash mid-write leaves the previous file intact instead of a truncated one.
+    The data is fsynced before the rename, so after a power loss the path holds
+    either the old or the new contents, never an empty file. The directory is
+    not fsynced: the rename may be lost, which just leaves the old file.
+
+    The temporary file is made owner-only (600) before any data goes in, and
+    the rename carries that mode over, so callers need no chmod afterwards.
+    """
+    tmp_path = file_path.with_name(file_path.name + ".tmp")
+    try:
+        # write_fn truncates and reuses this file, keeping its mode; the chmod
+        # covers a stale temporary file left with other permissions
+        os.close(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600))
+        _set_secure_permissions(tmp_path)
+        write_fn(tmp_path)
+        with open(tmp_path, "rb+") as f:
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _read_json_cached(file_path: Path) -> object:
+    """Parse a JSON file, reusing the previous parse while the file is unchanged.
+
+    Raises the same errors as open() + json.load(). The returned object is
+    shared with the cache: callers must copy it before handing it out.
+    """
+    signature = _stat_signature(os.stat(file_path))
+    cached = _json_cache.get(file_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers'
+        # error handling is the same either way
+        with open(file_path, "rb") as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(file_path, "r") as f:
+            data = json.load(f)
+    _json_cache[file_path] = (signature, data)
+    return data
+
+
+def _dataframe_digest(df: pd.DataFrame) -> Optional[str]:
+    """Hash a DataFrame's columns, dtypes and values (ignoring the index)."""
+    try:
+        row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    except TypeError:
+        # Unhashable cell values (e.g. lists): never treat as unchanged
+        return None
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr([(c, str(t)) for c, t in df.dtypes.items()]).encode())
+    h.update(row_hashes.tobytes())
+    return h.hexdigest()
+
+
 def clean_amount(amount_series: pd.Series) -> pd.Series:
-    s = amount_series.astype(str)
-    # Convert (amount) to -amount
-    s = s.str.replace(r"\((.*)\)", r"-\1", regex=True)
-    # Remove currency symbols and spaces
-    s = s.str.replace(r"[€$£,\s]", "", regex=True)
-    # Convert to numeric, coercing errors (e.g., '-' will become NaN)
-    numeric_series = pd.to_numeric(s, errors="coerce")
-    # Treat NaN (from '-' or other non-numeric values) as 0
-    return numeric_series.fillna(0)
+    # Already-numeric columns (e.g. pyarrow-parsed CSVs) skip the string work;
+    # non-finite values become 0 just as the string path would make them
+    if amount_series.dtype.kind in "fiu":
+        values = amount_series.to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+        np.copyto(values, 0.0, where=~np.isfinite(values))
+    else:
+        # Run the string cleanup through Arrow's vectorized RE2 kernels rather
+        # than pandas' per-element Python regex calls
+        arr = pa.array(amount_series.astype(str).to_numpy(), type=pa.string())
+        # Convert (amount) to -amount. Most exports use a minus sign instead,
+        # so a cheap literal scan lets them skip this regex pass entirely
+        if pc.any(pc.match_substring(arr, "(")).as_py():
+            arr = pc.replace_substring_regex(
+                arr, pattern=r"\((.*)\)", replacement=r"-\1"
+            )
+        # Remove currency symbols and spaces (including non-breaking spaces)
+        arr = pc.replace_substring_regex(arr, pattern=r"[€$£,\s\p{Zs}]", replacement="")
+        # Null out anything that isn't a number (e.g., '-') so the cast can't fail
+        is_number = pc.match_substring_regex(arr, _NUMBER_PATTERN)
+        arr = pc.if_else(is_number, arr, pa.scalar(None, type=pa.string()))
+        # Nulls come out as NaN in a fresh, writable buffer (a zero-copy view
+        # of the Arrow data would be read-only for whoever edits the result)
+        values = pc.cast(arr, pa.float64()).to_numpy(
+            zero_copy_only=False, writable=True
+        )
+        np.copyto(values, 0.0, where=np.isnan(values))
+
+    # Treat non-numeric values as 0 (above, in place) and round to cents once
+    # here, so imported amounts don't need re-rounding downstream
+    np.round(values, 2, out=values)
+    return pd.Series(values, index=amount_series.index, name=amount_series.name)
+
+
+def _coerce_transaction_dtypes(df: pd.DataFrame) -> None:
+    """Coerce Date/Amount/Merchant in place, skipping columns already typed.
+
+    Frames loaded from parquet are already datetime64/float64/str, so only
+    freshly imported data pays for the (string-parsing) conversions.
+    """
+    date_dtype = df["Date"].dtype
+    if not pd.api.types.is_datetime64_any_dtype(date_dtype):
+        df["Date"] = pd.to_datetime(df["Date"])
+    elif isinstance(date_dtype, np.dtype) and date_dtype != "datetime64[ns]":
+        # Other resolutions (e.g. datetime64[us]) would send
+        # _concat_transactions down the slower pd.concat path
+        df["Date"] = df["Date"].astype("datetime64[ns]")
+    if not pd.api.types.is_float_dtype(df["Amount"]):
+        df["Amount"] = pd.to_numeric(df["Amount"], errors="coerce")
+    # Rounding is a cheap vectorized pass and keeps dedup keys consistent;
+    # done on the raw float64 buffer to skip the intermediate Series
+    amounts = df["Amount"].to_numpy(dtype=np.float64, na_value=np.nan)
+    df["Amount"] = np.round(np.where(np.isnan(amounts), 0.0, amounts), 2)
+    if not pd.api.types.is_string_dtype(df["Merchant"]):
+        df["Merchant"] = df["Merchant"].astype(str)
 
 
 # --- Category Management ---
@@ -86,12 +282,10 @@ def load_categories() -> Dict[str, str]:
         Dictionary mapping merchant names to categories, or empty dict if file
         doesn't exist or is corrupted.
     """
-    if not CATEGORIES_FILE.exists():
-        return {}
-
     try:
-        with open(CATEGORIES_FILE, "r") as f:
-            return json.load(f)
+        return copy.copy(_read_json_cached(CATEGORIES_FILE))
+    except FileNotFoundError:
+        return {}
     except json.JSONDecodeError as e:
         logging.warning(
             f"Categories file is corrupted (invalid JSON): {e}. "
@@ -115,47 +309,49 @@ def load_default_categories(transaction_type: str = None) -> List[str]:
     Returns:
         List of category names.
     """
+    global _package_default_categories
+
     categories_data = None
 
     # User's custom default categories file takes precedence
-    if DEFAULT_CATEGORIES_FILE.exists():
-        with open(DEFAULT_CATEGORIES_FILE, "r") as f:
-            try:
-                categories_data = json.load(f)
-            except json.JSONDecodeError:
-                pass  # Fallback to package default
+    try:
+        categories_data = _read_json_cached(DEFAULT_CATEGORIES_FILE)
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass  # Fallback to package default
 
     # If user file doesn't exist or is invalid, load from package
     if categories_data is None:
         try:
-            ref = importlib.resources.files("expenses").joinpath(
-                "default_categories.json"
-            )
-            with ref.open("r") as f:
-                categories_data = json.load(f)
-                # Copy it to user's config dir for first run
-                try:
-                    with open(DEFAULT_CATEGORIES_FILE, "w") as user_f:
-                        json.dump(categories_data, user_f, indent=4)
-                except IOError:
-                    logging.warning(
-                        "Could not save default categories to user config directory."
-                    )
+            if _package_default_categories is None:
+                ref = importlib.resources.files("expenses").joinpath(
+                    "default_categories.json"
+                )
+                with ref.open("r") as f:
+                    _package_default_categories = json.load(f)
         except (FileNotFoundError, json.JSONDecodeError):
             return []
+        categories_data = _package_default_categories
+        # Copy it to user's config dir for first run
+        try:
+            with open(DEFAULT_CATEGORIES_FILE, "w") as user_f:
+                json.dump(categories_data, user_f, indent=4)
+        except IOError:
+            logging.warning(
+                "Could not save default categories to user config directory."
+            )
 
     # Handle both old format (list) and new format (dict with expense/income keys)
     if isinstance(categories_data, list):
         # Old format: list of categories (all are expense categories)
         if transaction_type == "income":
             return []  # No income categories in old format
-        return categories_data
+        return list(categories_data)
     elif isinstance(categories_data, dict):
         # New format: dict with "expense" and "income" keys
         if transaction_type == "expense":
-            return categories_data.get("expense", [])
+            return list(categories_data.get("expense", []))
         elif transaction_type == "income":
-            return categories_data.get("income", [])
+            return list(categories_data.get("income", []))
         else:
             # Return all categories combined
             return categories_data.get("expense", []) + categories_data.get(
@@ -166,10 +362,16 @@ def load_default_categories(transaction_type: str = None) -> List[str]:
 
 
 def save_categories(categories: Dict[str, str]) -> None:
+    payload = json.dumps(categories, indent=4)
+    digest = hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+    if _is_unchanged(CATEGORIES_FILE, digest):
+        logging.debug("Categories unchanged, skipping rewrite")
+        return
+
     _ensure_secure_config_dir()
-    with open(CATEGORIES_FILE, "w") as f:
-        json.dump(categories, f, indent=4)
-    _set_secure_permissions(CATEGORIES_FILE)
+    _json_cache.pop(CATEGORIES_FILE, None)
+    _atomic_write(CATEGORIES_FILE, lambda tmp: tmp.write_text(payload))
+    _remember_saved(CATEGORIES_FILE, digest)
 
 
 # --- Category Types (Essential/Discretionary) Management ---
@@ -182,12 +384,12 @@ def load_category_types() -> dict:
     """
     category_types = None
 
-    if CATEGORY_TYPES_FILE.exists():
-        try:
-            with open(CATEGORY_TYPES_FILE, "r") as f:
-                category_types = json.load(f)
-        except json.JSONDecodeError:
-            pass  # Fallback to package default
+    try:
+        # Screens reload this on every refresh; reuse the parse while the
+        # file is unchanged. Callers edit the nested dicts, so deep-copy.
+        category_types = copy.deepcopy(_read_json_cached(CATEGORY_TYPES_FILE))
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass  # Fallback to package default
 
     if category_types is None:
         try:
@@ -216,6 +418,8 @@ def load_category_types() -> dict:
 def save_category_types(data: dict) -> None:
     """Save category type mappings to JSON file."""
     _ensure_secure_config_dir()
+    # Written in place, so a same-size rewrite could keep its cached signature
+    _json_cache.pop(CATEGORY_TYPES_FILE, None)
     with open(CATEGORY_TYPES_FILE, "w") as f:
         json.dump(data, f, indent=4)
     _set_secure_permissions(CATEGORY_TYPES_FILE)
@@ -311,12 +515,10 @@ def load_merchant_aliases() -> Dict[str, str]:
         Dictionary mapping regex patterns to display aliases, or empty dict if file
         doesn't exist or is corrupted.
     """
-    if not MERCHANT_ALIASES_FILE.exists():
-        return {}
-
     try:
-        with open(MERCHANT_ALIASES_FILE, "r") as f:
-            return json.load(f)
+        return copy.copy(_read_json_cached(MERCHANT_ALIASES_FILE))
+    except FileNotFoundError:
+        return {}
     except json.JSONDecodeError as e:
         logging.warning(
             f"Merchant aliases file is corrupted (invalid JSON): {e}. "
@@ -337,12 +539,167 @@ def save_merchant_aliases(aliases: Dict[str, str]) -> None:
         aliases: Dictionary mapping regex patterns to display aliases
     """
     _ensure_secure_config_dir()
+    # Written in place, so a same-size rewrite could keep its cached signature
+    _json_cache.pop(MERCHANT_ALIASES_FILE, None)
     with open(MERCHANT_ALIASES_FILE, "w") as f:
         json.dump(aliases, f, indent=4)
     _set_secure_permissions(MERCHANT_ALIASES_FILE)
     logging.info(f"Saved {len(aliases)} merchant alias patterns")
 
 
+def _fold_merchant(name: str) -> str:
+    """Lower-case name for substring tests against lower-cased ASCII literals."""
+    return name.translate(_ASCII_FOLD).lower()
+
+
+def _escape_end(pattern: str, i: int) -> int:
+    """Index just past the escape whose backslash is at pattern[i].
+
+    Multi-character escapes (\\x41, \\u0041, \\N{...}, \\12) are taken whole.
+    """
+    escaped = pattern[i + 1 : i + 2]
+    i += 2
+    if escaped == "N" and pattern[i : i + 1] == "{":
+        return pattern.find("}", i) + 1 or len(pattern)
+    if escaped.isalnum():
+        while i < len(pattern) and pattern[i].isalnum():
+            i += 1
+    return i
+
+
+def _class_end(pattern: str, i: int) -> int:
+    """Index just past the character class opening at pattern[i]."""
+    i += 1
+    # A leading "^" and "]" are part of the class
+    if pattern[i : i + 1] == "^":
+        i += 1
+    if pattern[i : i + 1] == "]":
+        i += 1
+    while i < len(pattern) and pattern[i] != "]":
+        i += 2 if pattern[i] == "\\" else 1
+    return i + 1
+
+
+def _regex_tokens(pattern: str) -> Iterator[str]:
+    """Split pattern into escapes, character classes, {m,n} quantifiers,
+    greedy ".*" and single characters.
+
+    ".*?" and ".*+" are not greedy ".*", so they split into single
+    characters instead.
+    """
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            end = _escape_end(pattern, i)
+        elif ch == "[":
+            end = _class_end(pattern, i)
+        elif ch == "{" and (repeat := _REPEAT_QUANTIFIER.match(pattern, i)):
+            end = repeat.end()
+        elif pattern[i : i + 2] == ".*" and pattern[i + 2 : i + 3] not in ("?", "+"):
+            end = i + 2
+        else:
+            end = i + 1
+        yield pattern[i:end]
+        i = end
+
+
+def _required_literal(pattern: str) -> str:
+    """Return the longest ASCII text that every match of pattern must contain.
+
+    A conservative scan: only plain characters outside groups and character
+    classes count, a character made optional by a quantifier is dropped,
+    and patterns with alternation yield "" (no usable literal).
+    """
+    if "|" in pattern:
+        return ""
+
+    best = ""
+    run = ""
+    depth = 0
+    for token in _regex_tokens(pattern):
+        if token == "(":
+            depth += 1
+        elif token == ")":
+            depth -= 1
+        elif token in ("?", "*") or len(token) > 2 and token[0] == "{":
+            # The preceding character may be absent (or repeated)
+            run = run[:-1]
+        elif depth == 0 and len(token) == 1 and token.isascii() and token not in "+.^$":
+            run += token
+            continue
+        best, run = max(best, run, key=len), ""
+    return max(best, run, key=len).lower()
+
+
+def _simplify_alias_pattern(pattern: str) -> str:
+    """Drop ".*" that can't change whether re.search finds a match.
+
+    Repeated ".*.*" collapses to one and a leading or trailing ".*" is
+    removed (re.search already tries every start position, and ".*" may
+    match nothing), so failing searches don't backtrack through them. Escapes and character
+    classes are copied untouched. Only the compiled form changes: the
+    user's alias file keeps the pattern as written.
+    """
+    tokens = []
+    for token in _regex_tokens(pattern):
+        if token == ".*" and tokens and tokens[-1] == ".*":
+            continue
+        tokens.append(token)
+
+    if tokens and tokens[-1] == ".*":
+        tokens.pop()
+    if tokens and tokens[0] == ".*":
+        tokens.pop(0)
+    return "".join(tokens)
+
+
+def _compile_merchant_aliases(aliases: Dict[str, str]) -> List[tuple]:
+    """Compile alias patterns once per distinct alias content.
+
+    Returns a list of matchers, (literal, regex, alias) in dict order.
+    Plain ASCII patterns have no regex and match when their lower-cased
+    text is in the folded merchant name. Other patterns keep a literal they
+    require (possibly "") that is checked before running the regex, so most
+    non-matching patterns are rejected by a substring test. Patterns are
+    simplified with _simplify_alias_pattern first. Invalid patterns are
+    logged once here and left out.
+
+    The cache is keyed on the alias items rather than the dict's identity,
+    since load_merchant_aliases returns a new dict on every call.
+    """
+    global _alias_cache
+
+    items = tuple(aliases.items())
+    if _alias_cache is not None and _alias_cache[0] == items:
+        return _alias_cache[1]
+
+    matchers = []
+    for pattern, alias in items:
+        try:
+            compiled = re.compile(pattern, re.IGNORECASE)
+        except re.error as e:
+            logging.warning(
+                f"Invalid regex pattern '{pattern}' in merchant aliases: {e}"
+            )
+            continue
+        if not compiled.flags & re.VERBOSE:
+            simplified = _simplify_alias_pattern(pattern)
+            if simplified != pattern:
+                logging.debug(f"Matching alias pattern '{pattern}' as '{simplified}'")
+                pattern = simplified
+                compiled = re.compile(pattern, re.IGNORECASE)
+        if pattern.isascii() and not _REGEX_METACHARS.intersection(pattern):
+            matchers.append((pattern.lower(), None, alias))
+            continue
+        # Verbose patterns ignore whitespace, so their text isn't literal
+        literal = "" if compiled.flags & re.VERBOSE else _required_literal(pattern)
+        matchers.append((literal, compiled, alias))
+
+    _alias_cache = (items, matchers)
+    return matchers
+
+
 def apply_merchant_alias(merchant_name: str, aliases: Dict[str, str]) -> str:
     """Apply merchant alias based on regex pattern matching.
 
@@ -356,16 +713,27 @@ def apply_merchant_alias(merchant_name: str, aliases: Dict[str, str]) -> str:
     if not merchant_name or not aliases:
         return merchant_name
 
+    matchers = _compile_merchant_aliases(aliases)
+    return _match_merchant_alias(merchant_name, matchers)
+
+
+def _match_merchant_alias(merchant_name: str, matchers: List[tuple]) -> str:
+    """Return the alias of the first matcher that matches merchant_name.
+
+    Takes the matchers from _compile_merchant_aliases, so callers looping
+    over many names look the compiled aliases up once rather than per name.
+    """
+    if not merchant_name:
+        return merchant_name
+
+    folded_name = _fold_merchant(merchant_name)
+
     # Try each pattern in order (patterns are checked in dict order)
-    for pattern, alias in aliases.items():
-        try:
-            if re.search(pattern, merchant_name, re.IGNORECASE):
-                return alias
-        except re.error as e:
-            logging.warning(
-                f"Invalid regex pattern '{pattern}' in merchant aliases: {e}"
-            )
+    for literal, regex, alias in matchers:
+        if literal not in folded_name:
             continue
+        if regex is None or regex.search(merchant_name):
+            return alias
 
     return merchant_name
 
@@ -382,10 +750,35 @@ def apply_merchant_aliases_to_series(
     Returns:
         Series with aliases applied
     """
-    if not aliases:
+    if not aliases or merchant_series.empty:
         return merchant_series
 
-    return merchant_series.apply(lambda x: apply_merchant_alias(x, aliases))
+    matchers = _compile_merchant_aliases(aliases)
+    if not (
+        merchant_series.dtype == object
+        or pd.api.types.is_string_dtype(merchant_series.dtype)
+    ):
+        return merchant_series.apply(lambda x: _match_merchant_alias(x, matchers))
+
+    # Merchant names repeat heavily (every POS purchase at the same shop), so
+    # match each distinct name once and broadcast back by factorized code
+    codes, uniques = pd.factorize(merchant_series)
+    if len(uniques) == 0:
+        return merchant_series
+    names = np.asarray(uniques, dtype=object)
+
+    # A per-name loop beats one fused alternation regex here: the substring
+    # prefilter rejects most patterns without running them, while a fused
+    # pattern has to scan every name once per alternative
+    aliased = np.array(
+        [_match_merchant_alias(name, matchers) for name in names], dtype=object
+    )
+
+    # Missing values (code -1) pass through unchanged
+    result = np.where(
+        codes >= 0, aliased[codes], merchant_series.to_numpy(dtype=object)
+    )
+    return pd.Series(result, index=merchant_series.index, name=merchant_series.name)
 
 
 # --- Transaction Loading & Saving ---
@@ -395,7 +788,7 @@ def get_unique_sources() -> List[str]:
     Returns:
         Sorted list of unique source names, excluding 'Unknown'.
     """
-    df = load_transactions_from_parquet(include_deleted=False)
+    df = load_transactions_from_parquet(include_deleted=False, columns=["Source"])
     if df.empty or "Source" not in df.columns:
         return []
 
@@ -405,11 +798,78 @@ def get_unique_sources() -> List[str]:
     return sorted(sources)
 
 
-def load_transactions_from_parquet(include_deleted: bool = False) -> pd.DataFrame:
+def _read_transactions_table() -> pa.Table:
+    """Read the transactions parquet file through a memory map.
+
+    Unchanged files never get here (see _transactions_cache), so the footer
+    is not cached separately. The memory map is released after every read:
+    holding it open would block the atomic replace on Windows, and backup
+    restores overwrite the file in place.
+    """
+    with pq.ParquetFile(TRANSACTIONS_FILE, memory_map=True) as parquet_file:
+        return parquet_file.read(use_pandas_metadata=True)
+
+
+def _select_transactions(
+    df: pd.DataFrame, include_deleted: bool, columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """Return a private copy of df, without soft-deleted rows unless requested.
+
+    Callers modify the frames they load in place, so the cached frame must
+    never be handed out directly. When columns is given only those (that
+    exist) are copied.
+    """
+    deleted = df["Deleted"].to_numpy(dtype=bool)
+    if columns is not None:
+        df = df[[col for col in columns if col in df.columns]]
+    if include_deleted:
+        return df.copy()
+    # take() gathers the kept rows into new arrays in one pass; boolean
+    # indexing would too, but marks the result as a possible view (so callers
+    # get SettingWithCopyWarning) and needed a second .copy() to clear that
+    return df.take(np.flatnonzero(~deleted))
+
+
+def _migrate_transactions(df: pd.DataFrame) -> pd.DataFrame:
+    """Bring a frame read from the transactions file up to the current schema."""
+    # Add Source column if it doesn't exist (backward compatibility)
+    if "Source" not in df.columns:
+        df["Source"] = "Unknown"
+
+    # Add Deleted column if it doesn't exist (backward compatibility)
+    if "Deleted" not in df.columns:
+        df["Deleted"] = False
+
+    # Add Type column if it doesn't exist (backward compatibility for cash flow support)
+    if "Type" not in df.columns:
+        df["Type"] = "expense"  # Default existing transactions to expense
+
+    # Add Tags column if it doesn't exist (backward compatibility)
+    if "Tags" not in df.columns:
+        df["Tags"] = ""
+    df["Tags"] = df["Tags"].fillna("").astype(str)
+
+    # One-time migration: fold legacy Emergency boolean into Tags
+    if "Emergency" in df.columns:
+        emergency_mask = df["Emergency"].fillna(False).astype(bool)
+        df.loc[emergency_mask, "Tags"] = df.loc[emergency_mask, "Tags"].apply(
+            lambda cell: add_tags_to_cell(cell, ["emergency"])
+        )
+        df = df.drop(columns=["Emergency"])
+        logging.info("Migrated legacy Emergency column into Tags")
+
+    return df
+
+
+def load_transactions_from_parquet(
+    include_deleted: bool = False, columns: Optional[List[str]] = None
+) -> pd.DataFrame:
     """Load transactions from parquet file with corruption detection.
 
     Args:
         include_deleted: If True, include soft-deleted transactions. Default False.
+        columns: Only return these columns (those that exist), so callers that
+            need one or two columns don't copy the whole frame. Default all.
 
     Returns:
         DataFrame with transactions, or empty DataFrame if file doesn't exist
@@ -419,48 +879,47 @@ def load_transactions_from_parquet(include_deleted: bool = False) -> pd.DataFram
         If corruption is detected, logs a warning suggesting backup restoration.
         The application will continue with an empty DataFrame rather than crashing.
         Sets global _corruption_detected flag for TUI notification.
+
+        The returned index is each row's position in the file (deleted rows
+        keep their slot). update_transactions and tag_transactions address
+        rows by it, so the file must be read whole and in stored order:
+        partitioned datasets or row-filtered reads would renumber rows.
+
+        Text columns (Merchant, Source, Type, Tags, Category) are NumPy object
+        dtype, not Arrow-backed strings. Their missing values would become
+        pd.NA, whose truth value raises, and the screens and apply_merchant_alias
+        test merchant names with plain `if merchant`. They aren't categorical
+        either: update_transactions assigns arbitrary new values with .at,
+        which a categorical column rejects for unseen values. The hot string
+        paths (dedup, key matching, aliasing) already factorize to integer
+        codes once per distinct value, which is what category would buy.
     """
-    global _corruption_detected
+    global _corruption_detected, _transactions_cache
 
-    if not TRANSACTIONS_FILE.exists():
+    # One stat serves as both the existence check and the cache key
+    try:
+        st = os.stat(TRANSACTIONS_FILE)
+    except FileNotFoundError:
         return pd.DataFrame(
             columns=["Date", "Merchant", "Amount", "Source", "Deleted", "Type", "Tags"]
         )
 
+    signature = _stat_signature(st)
     try:
-        df = pd.read_parquet(TRANSACTIONS_FILE)
-
-        # Add Source column if it doesn't exist (backward compatibility)
-        if "Source" not in df.columns:
-            df["Source"] = "Unknown"
-
-        # Add Deleted column if it doesn't exist (backward compatibility)
-        if "Deleted" not in df.columns:
-            df["Deleted"] = False
-
-        # Add Type column if it doesn't exist (backward compatibility for cash flow support)
-        if "Type" not in df.columns:
-            df["Type"] = "expense"  # Default existing transactions to expense
-
-        # Add Tags column if it doesn't exist (backward compatibility)
-        if "Tags" not in df.columns:
-            df["Tags"] = ""
-        df["Tags"] = df["Tags"].fillna("").astype(str)
-
-        # One-time migration: fold legacy Emergency boolean into Tags
-        if "Emergency" in df.columns:
-            emergency_mask = df["Emergency"].fillna(False).astype(bool)
-            df.loc[emergency_mask, "Tags"] = df.loc[emergency_mask, "Tags"].apply(
-                lambda cell: add_tags_to_cell(cell, ["emergency"])
-            )
-            df = df.drop(columns=["Emergency"])
-            logging.info("Migrated legacy Emergency column into Tags")
+        cached = _transactions_cache
+        if cached is not None and cached[:2] == (TRANSACTIONS_FILE, signature):
+            # Unchanged since the last load: skip decoding the file again
+            return _select_transactions(cached[2], include_deleted, columns)
+
+        # The table is private to this call, so let pyarrow free each column
+        # as it is converted and skip consolidating them into 2D blocks
+        df = _read_transactions_table().to_pandas(split_blocks=True, self_destruct=True)
 
-        # Filter out soft-deleted transactions unless explicitly requested
-        if not include_deleted:
-            df = df[~df["Deleted"]].copy()
+        df = _migrate_transactions(df)
 
-        return df
+        result = _select_transactions(df, include_deleted, columns)
+        _transactions_cache = (TRANSACTIONS_FILE, signature, df)
+        return result
     except Exception as e:
         # Catch all parquet-related errors: ArrowInvalid, OSError, etc.
         error_msg = f"Transactions file corrupted: {type(e).__name__}"
@@ -491,9 +950,23 @@ def check_and_clear_corruption_flag() -> Optional[str]:
     return msg
 
 
+def _write_transactions_table(table: pa.Table, path: Path) -> None:
+    """Write transactions as parquet, compressed for small size and fast re-reads.
+
+    Every column keeps pyarrow's default dictionary encoding, which suits
+    the heavily repeated Merchant/Source/Type/Tags values; zstd at level 1
+    compresses those pages tighter than the default snappy at similar
+    decode speed.
+    """
+    pq.write_table(table, path, compression="zstd", compression_level=1)
+
+
 def save_transactions_to_parquet(df: pd.DataFrame) -> None:
     """Save transactions to parquet file.
 
+    The file is written atomically (temporary file + rename), and the write is
+    skipped entirely when the data is identical to what was last saved.
+
     Args:
         df: DataFrame to save
 
@@ -501,12 +974,83 @@ def save_transactions_to_parquet(df: pd.DataFrame) -> None:
         Validation should be done before calling this function (e.g., in append_transactions).
         This function assumes the data is already validated.
     """
+    digest = _dataframe_digest(df)
+    if _is_unchanged(TRANSACTIONS_FILE, digest):
+        logging.debug("Transactions unchanged, skipping parquet rewrite")
+        return
+
+    global _transactions_cache
+
     _ensure_secure_config_dir()
-    df.to_parquet(TRANSACTIONS_FILE, index=False)
-    _set_secure_permissions(TRANSACTIONS_FILE)
+    _transactions_cache = None
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    _atomic_write(TRANSACTIONS_FILE, lambda tmp: _write_transactions_table(table, tmp))
+    _remember_saved(TRANSACTIONS_FILE, digest)
+
+    # Callers usually reload right after saving. The table just written
+    # converts to exactly the frame a read of the file would produce, so
+    # seed the load cache from it instead of decoding the file again. The
+    # table wraps df's own numeric arrays; unlike split_blocks=True, the
+    # default conversion copies them into new blocks, so later edits to df
+    # can't leak into the cache.
+    signature = _file_signature(TRANSACTIONS_FILE)
+    if signature is not None:
+        loaded = table.to_pandas()
+        _transactions_cache = (
+            TRANSACTIONS_FILE,
+            signature,
+            _migrate_transactions(loaded),
+        )
     logging.debug(f"Saved {len(df)} transactions to {TRANSACTIONS_FILE}")
 
 
+def _concat_transactions(first: pd.DataFrame, second: pd.DataFrame) -> pd.DataFrame:
+    """Stack two transaction frames with a fresh RangeIndex.
+
+    When both frames hold the same columns with identical NumPy dtypes (the
+    usual case once dtypes are normalized), each column's backing array is
+    concatenated directly, skipping pd.concat's block alignment and index
+    handling. Anything else falls back to pd.concat.
+    """
+    same_schema = set(first.columns) == set(second.columns) and all(
+        isinstance(first[col].dtype, np.dtype) and first[col].dtype == second[col].dtype
+        for col in first.columns
+    )
+    if not same_schema:
+        return pd.concat([first, second], ignore_index=True)
+
+    return pd.DataFrame(
+        {
+            col: np.concatenate([first[col].to_numpy(), second[col].to_numpy()])
+            for col in first.columns
+        },
+        copy=False,
+    )
+
+
+def _suggest_new_categories(merchants: pd.Series) -> Optional[Dict[str, str]]:
+    """Return the categories updated with suggestions for unknown merchants.
+
+    None if there was nothing to suggest; the result is not saved here.
+    """
+    categories = load_categories()
+    # Hashed set difference in pandas rather than a Python membership loop
+    merchants_to_categorize = pd.Index(merchants.astype(str).unique()).difference(
+        pd.Index(list(categories), dtype=object), sort=False
+    )
+    if not len(merchants_to_categorize):
+        return None
+
+    # Get all suggestions in a single API call
+    suggested_categories = get_gemini_category_suggestions_for_merchants(
+        merchants_to_categorize.tolist()
+    )
+    if not suggested_categories:
+        return None
+    categories.update(suggested_categories)
+    return categories
+
+
 def append_transactions(
     new_transactions: pd.DataFrame,
     suggest_categories: bool = False,
@@ -525,25 +1069,11 @@ def append_transactions(
     # Validate new transactions before appending
     validate_transaction_dataframe(new_transactions)
 
-    # Create auto-backup before modifying data
-    create_auto_backup()
-
+    # Suggested categories are saved only after the auto-backup below, so the
+    # backup holds the categories from before this import
+    updated_categories = None
     if suggest_categories:
-        categories = load_categories()
-        unique_new_merchants = new_transactions["Merchant"].unique()
-        merchants_to_categorize = [
-            m for m in unique_new_merchants if m not in categories
-        ]
-
-        if merchants_to_categorize:
-            # Get all suggestions in a single API call
-            suggested_categories = get_gemini_category_suggestions_for_merchants(
-                merchants_to_categorize
-            )
-            # Update the main categories dictionary with the new suggestions
-            if suggested_categories:
-                categories.update(suggested_categories)
-                save_categories(categories)
+        updated_categories = _suggest_new_categories(new_transactions["Merchant"])
 
     # Load existing transactions (including deleted ones to preserve soft-delete state)
     existing_transactions = load_transactions_from_parquet(include_deleted=True)
@@ -565,73 +1095,60 @@ def append_transactions(
         new_transactions["Tags"] = ""
 
     # Standardize data types before merging
-    existing_transactions["Date"] = pd.to_datetime(existing_transactions["Date"])
-    existing_transactions["Amount"] = pd.to_numeric(
-        existing_transactions["Amount"], errors="coerce"
-    ).fillna(0.0)
-    existing_transactions["Amount"] = existing_transactions["Amount"].round(2)
-    existing_transactions["Merchant"] = existing_transactions["Merchant"].astype(str)
+    _coerce_transaction_dtypes(existing_transactions)
     existing_transactions["Type"] = existing_transactions["Type"].astype(str)
     if "Tags" not in existing_transactions.columns:
         existing_transactions["Tags"] = ""
     existing_transactions["Tags"] = existing_transactions["Tags"].fillna("").astype(str)
 
-    new_transactions["Date"] = pd.to_datetime(new_transactions["Date"])
-    new_transactions["Amount"] = pd.to_numeric(
-        new_transactions["Amount"], errors="coerce"
-    ).fillna(0.0)
-    new_transactions["Amount"] = new_transactions["Amount"].round(2)
-    new_transactions["Merchant"] = new_transactions["Merchant"].astype(str)
+    _coerce_transaction_dtypes(new_transactions)
     new_transactions["Type"] = new_transactions["Type"].astype(str)
     new_transactions["Tags"] = new_transactions["Tags"].fillna("").astype(str)
 
     # Load merchant aliases for deduplication (used for both soft-delete filtering and dedup)
     merchant_aliases = load_merchant_aliases()
 
+    # Alias each side once; the soft-delete filter and the dedup below both
+    # work on these rather than re-aliasing the deleted rows and the combined
+    # frame separately
+    if merchant_aliases:
+        existing_aliased = apply_merchant_aliases_to_series(
+            existing_transactions["Merchant"], merchant_aliases
+        )
+        new_aliased = apply_merchant_aliases_to_series(
+            new_transactions["Merchant"], merchant_aliases
+        )
+    else:
+        existing_aliased = existing_transactions["Merchant"]
+        new_aliased = new_transactions["Merchant"]
+
     # --- Filter out new transactions that match soft-deleted ones ---
     deleted_mask = existing_transactions["Deleted"]
     if deleted_mask.any():
         deleted_transactions = existing_transactions[deleted_mask]
-
-        # Apply merchant aliases to deleted transactions for matching
-        if merchant_aliases:
-            deleted_aliased = apply_merchant_aliases_to_series(
-                deleted_transactions["Merchant"], merchant_aliases
-            )
-        else:
-            deleted_aliased = deleted_transactions["Merchant"]
-
-        # Create a set of (Date, AliasedMerchant, Amount) tuples for efficient lookup
-        deleted_keys = set(
-            zip(
-                deleted_transactions["Date"].dt.date,
-                deleted_aliased,
-                deleted_transactions["Amount"],
-            )
+        deleted_aliased = existing_aliased[deleted_mask]
+
+        # Match (day, aliased merchant, amount) keys with one hashed isin
+        # rather than a Python tuple lookup per new row
+        deleted_keys = pd.DataFrame(
+            {
+                "Date": deleted_transactions["Date"].dt.normalize(),
+                "Merchant": deleted_aliased,
+                "Amount": deleted_transactions["Amount"],
+            }
+        )
+        new_keys = pd.DataFrame(
+            {
+                "Date": new_transactions["Date"].dt.normalize(),
+                "Merchant": new_aliased,
+                "Amount": new_transactions["Amount"],
+            }
         )
-
-        # Apply merchant aliases to new transactions for matching
-        if merchant_aliases:
-            new_aliased = apply_merchant_aliases_to_series(
-                new_transactions["Merchant"], merchant_aliases
-            )
-        else:
-            new_aliased = new_transactions["Merchant"]
 
         initial_count = len(new_transactions)
-        # Create a boolean mask to identify rows to keep
-        keep_mask = ~pd.Series(
-            [
-                (date.date(), alias, amount) in deleted_keys
-                for date, alias, amount in zip(
-                    new_transactions["Date"],
-                    new_aliased,
-                    new_transactions["Amount"],
-                )
-            ],
-            index=new_transactions.index,
-        )
+        keep_mask = ~_match_transaction_keys(new_keys, deleted_keys)
         new_transactions = new_transactions[keep_mask]
+        new_aliased = new_aliased[keep_mask]
         final_count = len(new_transactions)
 
         if initial_count > final_count:
@@ -642,28 +1159,41 @@ def append_transactions(
             )
 
     # Now combine and deduplicate
-    combined = pd.concat([existing_transactions, new_transactions], ignore_index=True)
+    combined = _concat_transactions(existing_transactions, new_transactions)
 
-    # Create a temporary column with aliased merchant names for deduplication
-    # This allows "STARBUCKS #1234" and "Starbucks Coffee" to be recognized as duplicates
-    # if they both map to the same alias
-    if merchant_aliases:
-        combined["_DedupeKey"] = apply_merchant_aliases_to_series(
-            combined["Merchant"], merchant_aliases
-        )
-    else:
-        combined["_DedupeKey"] = combined["Merchant"]
+    # Deduplicate on aliased merchant names, so "STARBUCKS #1234" and
+    # "Starbucks Coffee" are recognized as duplicates if they both map to the
+    # same alias
+    dedupe_merchants = np.concatenate(
+        [existing_aliased.to_numpy(dtype=object), new_aliased.to_numpy(dtype=object)]
+    )
 
     # De-duplicate based on Date, Aliased Merchant, Amount (keep first occurrence)
     # This prevents the same transaction from being imported multiple times, regardless of source
     # It also handles cases where a transaction is re-imported after being restored.
-    combined.drop_duplicates(
-        subset=["Date", "_DedupeKey", "Amount"], keep="first", inplace=True
-    )
-
-    # Remove the temporary deduplication column before saving
-    combined.drop(columns=["_DedupeKey"], inplace=True)
-
+    # The key columns live in their own frame: pandas factorizes each into
+    # int64 codes and hashes one combined group id, and combined itself never
+    # gains (and then drops) a temporary column.
+    duplicated = pd.DataFrame(
+        {
+            "Date": combined["Date"],
+            "Merchant": dedupe_merchants,
+            "Amount": combined["Amount"],
+        },
+        copy=False,
+    ).duplicated(keep="first")
+    if duplicated.any():
+        combined = combined[~duplicated.to_numpy()]
+
+    # Create auto-backup only if deduplication left something new to write or
+    # categories changed; re-importing the same file should not copy the
+    # whole dataset again. It runs before either file is written.
+    rows_added = len(combined) != len(existing_transactions)
+    if rows_added or updated_categories is not None:
+        create_auto_backup()
+
+    if updated_categories is not None:
+        save_categories(updated_categories)
     save_transactions_to_parquet(combined)
 
 
@@ -682,6 +1212,18 @@ def soft_delete_transactions(transaction_ids: List[int]) -> None:
     logging.info(f"Soft-deleted {len(transaction_ids)} transaction(s).")
 
 
+def _match_transaction_keys(df: pd.DataFrame, targets: pd.DataFrame) -> pd.Series:
+    """Flag rows of df whose (Date, Merchant, Amount) appears in targets.
+
+    A hashed isin over the composite key: unlike a left merge it never
+    duplicates rows of df when targets repeats a key, and keeps df's index.
+    """
+    key_columns = ["Date", "Merchant", "Amount"]
+    keys = pd.MultiIndex.from_frame(df[key_columns])
+    target_keys = pd.MultiIndex.from_frame(targets[key_columns])
+    return pd.Series(keys.isin(target_keys), index=df.index)
+
+
 def delete_transactions(transactions_to_delete: pd.DataFrame) -> None:
     """Soft-deletes transactions by marking them as deleted.
 
@@ -694,41 +1236,23 @@ def delete_transactions(transactions_to_delete: pd.DataFrame) -> None:
     if transactions_to_delete.empty:
         return
 
-    # Create auto-backup before deletion (critical operation)
-    create_auto_backup()
-
     # Load ALL transactions including already soft-deleted ones
     all_transactions = load_transactions_from_parquet(include_deleted=True)
 
-    # Ensure dtypes are consistent before merge
-    transactions_to_delete["Date"] = pd.to_datetime(transactions_to_delete["Date"])
-    transactions_to_delete["Amount"] = pd.to_numeric(
-        transactions_to_delete["Amount"], errors="coerce"
-    ).fillna(0.0)
-    transactions_to_delete["Amount"] = transactions_to_delete["Amount"].round(2)
-    transactions_to_delete["Merchant"] = transactions_to_delete["Merchant"].astype(str)
-
-    # Normalize all_transactions to match data types
-    all_transactions["Date"] = pd.to_datetime(all_transactions["Date"])
-    all_transactions["Amount"] = pd.to_numeric(
-        all_transactions["Amount"], errors="coerce"
-    ).fillna(0.0)
-    all_transactions["Amount"] = all_transactions["Amount"].round(2)
-    all_transactions["Merchant"] = all_transactions["Merchant"].astype(str)
-
-    # Mark transactions as deleted by merging and setting Deleted=True
-    # Use indicator to identify which rows to mark as deleted
-    merged = pd.merge(
-        all_transactions,
-        transactions_to_delete[["Date", "Merchant", "Amount"]],
-        on=["Date", "Merchant", "Amount"],
-        how="left",
-        indicator=True,
-    )
+    # Ensure dtypes are consistent before matching
+    _coerce_transaction_dtypes(transactions_to_delete)
+    _coerce_transaction_dtypes(all_transactions)
+
+    # Mark transactions as deleted by setting Deleted=True on matching rows
+    matched = _match_transaction_keys(all_transactions, transactions_to_delete)
+    newly_deleted = matched & ~all_transactions["Deleted"].fillna(False).astype(bool)
+    all_transactions.loc[matched, "Deleted"] = True
+    updated_transactions = all_transactions
 
-    # Set Deleted=True for matched rows
-    merged.loc[merged["_merge"] == "both", "Deleted"] = True
-    updated_transactions = merged.drop(columns=["_merge"])
+    # Create auto-backup before deletion (critical operation), but only when
+    # at least one row actually changes state
+    if newly_deleted.any():
+        create_auto_backup()
 
     num_deleted = updated_transactions["Deleted"].sum()
     logging.info(f"Soft-deleted {num_deleted} transactions")
@@ -752,8 +1276,8 @@ def update_transactions(updates: List[Dict]) -> int:
     if not updates:
         return 0
 
-    # Create auto-backup before modification
-    create_auto_backup()
+    # Create auto-backup in the background while the changes are applied
+    pending_backup = _backup_executor.submit(create_auto_backup)
 
     # Load ALL transactions including soft-deleted ones
     all_transactions = load_transactions_from_parquet(include_deleted=True)
@@ -778,11 +1302,13 @@ def update_transactions(updates: List[Dict]) -> int:
                 if field == "Date":
                     new_value = pd.to_datetime(new_value)
                 elif field == "Amount":
-                    new_value = float(new_value)
+                    new_value = round(float(new_value), 2)
                 all_transactions.at[original_index, field] = new_value
 
         updated_count += 1
 
+    # The backup must capture the file before it is overwritten
+    pending_backup.result()
     if updated_count > 0:
         # Validate modified DataFrame before saving
         validate_transaction_dataframe(all_transactions)
@@ -828,7 +1354,7 @@ def tag_transactions(indices: List[int], tags: List[str], mode: str = "add") ->
     if not clean_tags or not indices:
         return 0
 
-    create_auto_backup()
+    pending_backup = _backup_executor.submit(create_auto_backup)
     all_transactions = load_transactions_from_parquet(include_deleted=True)
 
     apply_fn = add_tags_to_cell if mode == "add" else remove_tags_from_cell
@@ -841,6 +1367,7 @@ def tag_transactions(indices: List[int], tags: List[str], mode: str = "add") ->
         all_transactions.at[original_index, "Tags"] = apply_fn(current, clean_tags)
         updated_count += 1
 
+    pending_backup.result()
     if updated_count:
         save_transactions_to_parquet(all_transactions)
         logging.info(f"{mode} tags {clean_tags} on {updated_count} transaction(s)")
@@ -856,44 +1383,23 @@ def restore_deleted_transactions(transactions_to_restore: pd.DataFrame) -> None:
     if transactions_to_restore.empty:
         return
 
-    # Create auto-backup before modification
-    create_auto_backup()
+    # Create auto-backup in the background while the changes are applied
+    pending_backup = _backup_executor.submit(create_auto_backup)
 
     # Load ALL transactions including soft-deleted ones
     all_transactions = load_transactions_from_parquet(include_deleted=True)
 
-    # Ensure dtypes are consistent before merge
-    transactions_to_restore["Date"] = pd.to_datetime(transactions_to_restore["Date"])
-    transactions_to_restore["Amount"] = pd.to_numeric(
-        transactions_to_restore["Amount"], errors="coerce"
-    ).fillna(0.0)
-    transactions_to_restore["Amount"] = transactions_to_restore["Amount"].round(2)
-    transactions_to_restore["Merchant"] = transactions_to_restore["Merchant"].astype(
-        str
-    )
-
-    # Normalize all_transactions to match data types
-    all_transactions["Date"] = pd.to_datetime(all_transactions["Date"])
-    all_transactions["Amount"] = pd.to_numeric(
-        all_transactions["Amount"], errors="coerce"
-    ).fillna(0.0)
-    all_transactions["Amount"] = all_transactions["Amount"].round(2)
-    all_transactions["Merchant"] = all_transactions["Merchant"].astype(str)
-
-    # Mark transactions as NOT deleted by merging and setting Deleted=False
-    merged = pd.merge(
-        all_transactions,
-        transactions_to_restore[["Date", "Merchant", "Amount"]],
-        on=["Date", "Merchant", "Amount"],
-        how="left",
-        indicator=True,
-    )
+    # Ensure dtypes are consistent before matching
+    _coerce_transaction_dtypes(transactions_to_restore)
+    _coerce_transaction_dtypes(all_transactions)
 
-    # Set Deleted=False for matched rows
-    merged.loc[merged["_merge"] == "both", "Deleted"] = False
-    updated_transactions = merged.drop(columns=["_merge"])
+    # Mark transactions as NOT deleted by setting Deleted=False on matching rows
+    matched = _match_transaction_keys(all_transactions, transactions_to_restore)
+    all_transactions.loc[matched, "Deleted"] = False
+    updated_transactions = all_transactions
 
-    num_restored = (merged["_merge"] == "both").sum()
+    num_restored = matched.sum()
     logging.info(f"Restored {num_restored} soft-deleted transactions")
 
+    pending_backup.result()
     save_transactions_to_parquet(updated_transactions)
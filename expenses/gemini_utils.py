@@ -1,10 +1,152 @@
-from google import genai
+import concurrent.futures
+import hashlib
+import time
 import os
 import json
+import re
 import logging
-from typing import List, Dict
+import threading
+from typing import TYPE_CHECKING, List, Dict, Optional
 
-from expenses.config import CATEGORIES_FILE, DEFAULT_CATEGORIES_FILE
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+from expenses.config import (
+    CATEGORIES_FILE,
+    DEFAULT_CATEGORIES_FILE,
+    GEMINI_CACHE_FILE,
+    GEMINI_CACHE_MAX_ENTRIES,
+    GEMINI_CACHE_TTL,
+    GEMINI_PARALLEL,
+)
+
+if TYPE_CHECKING:
+    # google.genai takes most of a second to import, so it is only imported
+    # once a request is actually about to be made
+    from google import genai
+
+_GEMINI_MODEL = "gemini-2.5-flash"
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so the error
+# handling below is the same with either parser. Both take bytes, so files
+# are read in binary and orjson parses them without a decode to str first.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# The body of a Markdown code fence (```json ... ```) around a reply; the
+# closing fence is optional in case the reply was cut short
+_FENCE_PATTERN = re.compile(r"```(?:json)?\s*(.*?)\s*(?:```|$)", re.DOTALL)
+
+# Merchants per request, so long imports don't risk a truncated reply, and
+# how many of those requests may be in flight at once (unless GEMINI_PARALLEL
+# says otherwise, e.g. to stay under a lower rate limit)
+_MERCHANTS_PER_REQUEST = 50
+_MAX_CONCURRENT_REQUESTS = 4
+
+# Attempts per request (including the first) when Gemini answers with a
+# transient error (408, 429 or 5xx), with exponential backoff and jitter
+# between them, capped at _RETRY_MAX_DELAY seconds
+_REQUEST_ATTEMPTS = 4
+_RETRY_MAX_DELAY = 16.0
+
+# Client for the last API key as (api_key, client), reused across calls so
+# its HTTP connections are too; building one takes tens of milliseconds
+_client_cache: Optional[tuple] = None
+_client_lock = threading.Lock()
+
+# Most suggestions kept in GEMINI_CACHE_FILE unless GEMINI_CACHE_MAX_ENTRIES
+# says otherwise; the least recently used (to within
+# _SUGGESTION_CACHE_TOUCH_INTERVAL) are dropped beyond this
+_SUGGESTION_CACHE_MAX_ENTRIES = 5000
+
+# How stale an entry's last-used time may get before a cache hit rewrites
+# the file to refresh it, so importing the same merchants again within a
+# day doesn't rewrite the whole cache every time
+_SUGGESTION_CACHE_TOUCH_INTERVAL = 24 * 60 * 60
+
+
+def _suggestion_cache_key(merchant_name: str, transaction_type: str) -> str:
+    """Cache key for a merchant's suggestion: a hash of the normalized name."""
+    normalized = f"{transaction_type}:{merchant_name.strip().casefold()}"
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+def _suggestion_cache_ttl() -> Optional[float]:
+    """Seconds a cached suggestion may be reused, from GEMINI_CACHE_TTL.
+
+    None (the default, or an unparseable value) keeps suggestions until
+    they are evicted.
+    """
+    if not GEMINI_CACHE_TTL:
+        return None
+    try:
+        return float(GEMINI_CACHE_TTL)
+    except ValueError:
+        logging.warning(f"Ignoring invalid GEMINI_CACHE_TTL: {GEMINI_CACHE_TTL!r}")
+        return None
+
+
+def _max_concurrent_requests() -> int:
+    """How many Gemini requests may run at once, from GEMINI_PARALLEL."""
+    if not GEMINI_PARALLEL:
+        return _MAX_CONCURRENT_REQUESTS
+    try:
+        return max(1, int(GEMINI_PARALLEL))
+    except ValueError:
+        logging.warning(f"Ignoring invalid GEMINI_PARALLEL: {GEMINI_PARALLEL!r}")
+        return _MAX_CONCURRENT_REQUESTS
+
+
+def _suggestion_cache_max_entries() -> int:
+    """How many suggestions the cache keeps, from GEMINI_CACHE_MAX_ENTRIES."""
+    if not GEMINI_CACHE_MAX_ENTRIES:
+        return _SUGGESTION_CACHE_MAX_ENTRIES
+    try:
+        return max(1, int(GEMINI_CACHE_MAX_ENTRIES))
+    except ValueError:
+        logging.warning(
+            f"Ignoring invalid GEMINI_CACHE_MAX_ENTRIES: {GEMINI_CACHE_MAX_ENTRIES!r}"
+        )
+        return _SUGGESTION_CACHE_MAX_ENTRIES
+
+
+def _load_suggestion_cache() -> Dict[str, dict]:
+    """Load cached Gemini suggestions, or {} if there are none or they're unreadable."""
+    if not GEMINI_CACHE_FILE.exists():
+        return {}
+    try:
+        with open(GEMINI_CACHE_FILE, "rb") as f:
+            data = _json_loads(f.read())
+    except (OSError, json.JSONDecodeError) as e:
+        logging.warning(f"Ignoring unreadable Gemini suggestion cache: {e}")
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_suggestion_cache(cache: Dict[str, dict]) -> None:
+    """Write the suggestion cache, keeping only the most recently used entries."""
+    max_entries = _suggestion_cache_max_entries()
+    if len(cache) > max_entries:
+        newest = sorted(
+            cache.items(), key=lambda item: item[1].get("timestamp", 0), reverse=True
+        )
+        cache = dict(newest[:max_entries])
+    # Not meant for hand-editing, so written compact (and by orjson if present)
+    payload = orjson.dumps(cache) if orjson is not None else json.dumps(cache).encode()
+    # Same temp-file convention as data_handler._atomic_write: owner-only
+    # permissions from creation, fsync'd before it replaces the real file
+    tmp_path = GEMINI_CACHE_FILE.with_name(GEMINI_CACHE_FILE.name + ".tmp")
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, GEMINI_CACHE_FILE)
+    except OSError as e:
+        logging.warning(f"Could not save Gemini suggestion cache: {e}")
+        tmp_path.unlink(missing_ok=True)
 
 
 def _load_existing_categories(transaction_type: str = "expense") -> List[str]:
@@ -17,8 +159,8 @@ def _load_existing_categories(transaction_type: str = "expense") -> List[str]:
         return _load_default_categories_for_type(transaction_type)
 
     try:
-        with open(CATEGORIES_FILE, "r") as f:
-            data = json.load(f)
+        with open(CATEGORIES_FILE, "rb") as f:
+            data = _json_loads(f.read())
             if isinstance(data, dict) and "categories" in data:
                 existing_categories = data["categories"]
             elif isinstance(data, list):
@@ -43,8 +185,8 @@ def _load_default_categories_for_type(transaction_type: str = "expense") -> List
         return []
 
     try:
-        with open(DEFAULT_CATEGORIES_FILE, "r") as f:
-            data = json.load(f)
+        with open(DEFAULT_CATEGORIES_FILE, "rb") as f:
+            data = _json_loads(f.read())
             if isinstance(data, dict):
                 return data.get(transaction_type, [])
             elif isinstance(data, list):
@@ -69,39 +211,14 @@ def _build_category_guidance(
     )
 
 
-def _build_gemini_prompt(
-    merchant_names: List[str], category_guidance: str, transaction_type: str = "expense"
-) -> str:
-    """Build the prompt for Gemini API."""
-    merchant_list_str = "\n".join([f"- {name}" for name in merchant_names])
-
-    if transaction_type == "income":
-        context = "income sources"
-        example_input = """- ACME Corporation
-    - PayPal Transfer
-    - Dividend Payment"""
-        example_output = """{
-        "ACME Corporation": "Salary/Wages",
-        "PayPal Transfer": "Freelance Income",
-        "Dividend Payment": "Dividends"
-    }"""
-    else:
-        context = "merchant names for expenses"
-        example_input = """- Starbucks
-    - Whole Foods
-    - Shell
-    - Netflix"""
-        example_output = """{
-        "Starbucks": "Coffee",
-        "Whole Foods": "Groceries",
-        "Shell": "Fuel",
-        "Netflix": "Subscriptions"
-    }"""
-
+def _make_prompt_template(context: str, example_input: str, example_output: str) -> str:
+    """Build a prompt template with {category_guidance}/{merchant_list} slots."""
+    # The example JSON's braces are literal text, not placeholders
+    example_output = example_output.replace("{", "{{").replace("}", "}}")
     return f"""
     You are an AI assistant that categorizes {context} for personal finance tracking.
     Given a list of names, return a single JSON object that maps each name
-    to a concise, relevant category. {category_guidance}
+    to a concise, relevant category. {{category_guidance}}
 
     Example Input:
     {example_input}
@@ -112,18 +229,156 @@ def _build_gemini_prompt(
     ```
 
     Here is the list to categorize:
-    {merchant_list_str}
+    {{merchant_list}}
 
     Return only the JSON object.
     """
 
 
+# The static parts of the prompt, built once rather than on every request
+_PROMPT_TEMPLATE_INCOME = _make_prompt_template(
+    "income sources",
+    """- ACME Corporation
+    - PayPal Transfer
+    - Dividend Payment""",
+    """{
+        "ACME Corporation": "Salary/Wages",
+        "PayPal Transfer": "Freelance Income",
+        "Dividend Payment": "Dividends"
+    }""",
+)
+_PROMPT_TEMPLATE_EXPENSE = _make_prompt_template(
+    "merchant names for expenses",
+    """- Starbucks
+    - Whole Foods
+    - Shell
+    - Netflix""",
+    """{
+        "Starbucks": "Coffee",
+        "Whole Foods": "Groceries",
+        "Shell": "Fuel",
+        "Netflix": "Subscriptions"
+    }""",
+)
+
+
+def _build_gemini_prompt(
+    merchant_names: List[str], category_guidance: str, transaction_type: str = "expense"
+) -> str:
+    """Build the prompt for Gemini API."""
+    template = (
+        _PROMPT_TEMPLATE_INCOME
+        if transaction_type == "income"
+        else _PROMPT_TEMPLATE_EXPENSE
+    )
+    # One join with the bullet in the separator, rather than a formatted
+    # string per merchant
+    merchant_list = "- " + "\n- ".join(merchant_names) if merchant_names else ""
+    return template.format(
+        category_guidance=category_guidance, merchant_list=merchant_list
+    )
+
+
 def _parse_gemini_response(response_text: str) -> Dict[str, str]:
     """Parse and clean the Gemini API response."""
-    cleaned_response = (
-        response_text.strip().replace("```json", "").replace("```", "").strip()
-    )
-    return json.loads(cleaned_response)
+    try:
+        # JSON mode replies are parsed as-is
+        return _json_loads(response_text)
+    except json.JSONDecodeError:
+        pass
+    match = _FENCE_PATTERN.search(response_text)
+    return _json_loads(match.group(1) if match else response_text)
+
+
+def _get_client(api_key: str) -> "genai.Client":
+    """Return the Gemini client for api_key, building it on first use."""
+    global _client_cache
+    with _client_lock:
+        if _client_cache is not None and _client_cache[0] == api_key:
+            return _client_cache[1]
+
+        from google import genai
+        from google.genai import types
+
+        # The SDK retries transient failures itself when given retry options;
+        # without them a single 429 or 503 would drop the whole batch
+        client = genai.Client(
+            api_key=api_key,
+            http_options=types.HttpOptions(
+                retry_options=types.HttpRetryOptions(
+                    attempts=_REQUEST_ATTEMPTS, max_delay=_RETRY_MAX_DELAY
+                )
+            ),
+        )
+        _client_cache = (api_key, client)
+        return client
+
+
+def _request_categories(
+    client: "genai.Client",
+    merchant_names: List[str],
+    category_guidance: str,
+    transaction_type: str,
+) -> Dict[str, str]:
+    """Ask Gemini to categorize one batch of merchants; {} if the call fails.
+
+    Transient errors have already been retried by the client by the time an
+    exception gets here.
+    """
+    from google.genai import types
+
+    prompt = _build_gemini_prompt(merchant_names, category_guidance, transaction_type)
+    try:
+        response = client.models.generate_content(
+            model=_GEMINI_MODEL,
+            contents=prompt,
+            # Ask for JSON mode so the reply is a bare JSON object, without
+            # the Markdown code fences the model otherwise wraps around it
+            config=types.GenerateContentConfig(response_mime_type="application/json"),
+        )
+        suggestions = _parse_gemini_response(response.text)
+        if not isinstance(suggestions, dict):
+            raise ValueError(
+                f"expected a JSON object, got {type(suggestions).__name__}"
+            )
+        return suggestions
+    except Exception as e:
+        logging.error(f"Error calling Gemini API or parsing response: {e}")
+        return {}
+
+
+def _cached_suggestions(
+    cache: Dict[str, dict],
+    merchant_names: List[str],
+    transaction_type: str,
+    now: float,
+) -> tuple:
+    """Answer merchant_names from cache where possible.
+
+    Returns (categories, uncached, touched): the cached suggestions, the
+    names that need a request, and whether any hit's last-used time was
+    refreshed in cache (older than _SUGGESTION_CACHE_TOUCH_INTERVAL), in
+    which case the cache is worth saving even without new suggestions.
+    """
+    ttl = _suggestion_cache_ttl()
+    categories: Dict[str, str] = {}
+    uncached = []
+    touched = False
+    for name in merchant_names:
+        entry = cache.get(_suggestion_cache_key(name, transaction_type))
+        if (
+            isinstance(entry, dict)
+            and "category" in entry
+            and entry.get("model") == _GEMINI_MODEL
+            and (ttl is None or now - entry.get("created", 0) <= ttl)
+        ):
+            categories[name] = entry["category"]
+            if now - entry.get("timestamp", 0) > _SUGGESTION_CACHE_TOUCH_INTERVAL:
+                entry["timestamp"] = now
+                touched = True
+        else:
+            uncached.append(name)
+    return categories, uncached, touched
 
 
 def get_gemini_category_suggestions_for_merchants(
@@ -131,6 +386,13 @@ def get_gemini_category_suggestions_for_merchants(
 ) -> Dict[str, str]:
     """Uses the Gemini API to suggest categories for a list of merchant names.
 
+    Suggestions are remembered in GEMINI_CACHE_FILE, so merchants seen in
+    earlier imports are answered without a request (for up to
+    GEMINI_CACHE_TTL seconds after they were fetched, if set). The rest are
+    sent in batches of _MERCHANTS_PER_REQUEST, up to GEMINI_PARALLEL
+    (default _MAX_CONCURRENT_REQUESTS) at a time. A batch that fails is
+    logged and contributes no suggestions; the others are still returned.
+
     Args:
         merchant_names: List of merchant/source names to categorize.
         transaction_type: "expense" or "income" to use appropriate categories.
@@ -143,23 +405,57 @@ def get_gemini_category_suggestions_for_merchants(
         logging.warning("GEMINI_API_KEY not set. Skipping category suggestions.")
         return {}
 
-    client = genai.Client(api_key=api_key)
+    merchant_names = list(dict.fromkeys(merchant_names))
+    if not merchant_names:
+        return {}
+
+    now = time.time()
+    cache = _load_suggestion_cache()
+    categories, uncached, touched = _cached_suggestions(
+        cache, merchant_names, transaction_type, now
+    )
+    if categories:
+        logging.info(f"Reusing {len(categories)} cached Gemini category suggestions.")
+    if not uncached:
+        if touched:
+            _save_suggestion_cache(cache)
+        return categories
+
+    client = _get_client(api_key)
 
     existing_categories = _load_existing_categories(transaction_type)
     category_guidance = _build_category_guidance(existing_categories, transaction_type)
-    prompt = _build_gemini_prompt(merchant_names, category_guidance, transaction_type)
 
-    try:
-        logging.info(
-            f"Requesting category suggestions for {len(merchant_names)} merchants from Gemini."
-        )
-        response = client.models.generate_content(
-            model="gemini-2.5-flash",
-            contents=prompt
-        )
-        categories = _parse_gemini_response(response.text)
-        logging.info(f"Received {len(categories)} category suggestions from Gemini.")
-        return categories
-    except Exception as e:
-        logging.error(f"Error calling Gemini API or parsing response: {e}")
-        return {}
+    batches = [
+        uncached[i : i + _MERCHANTS_PER_REQUEST]
+        for i in range(0, len(uncached), _MERCHANTS_PER_REQUEST)
+    ]
+    logging.info(
+        f"Requesting category suggestions for {len(uncached)} merchants "
+        f"from Gemini in {len(batches)} request(s)."
+    )
+
+    def request(batch: List[str]) -> Dict[str, str]:
+        return _request_categories(client, batch, category_guidance, transaction_type)
+
+    if len(batches) == 1:
+        results = [request(batches[0])]
+    else:
+        workers = min(_max_concurrent_requests(), len(batches))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(request, batches))
+
+    received = 0
+    for result in results:
+        for name, category in result.items():
+            categories[name] = category
+            cache[_suggestion_cache_key(name, transaction_type)] = {
+                "category": category,
+                "model": _GEMINI_MODEL,
+                "created": now,
+                "timestamp": now,
+            }
+        received += len(result)
+    _save_suggestion_cache(cache)
+    logging.info(f"Received {received} category suggestions from Gemini.")
+    return categories
@@ -7,21 +7,30 @@ class TrueLayerCodeStore:
     def __init__(self):
         self.auth_code = None
         self.lock = threading.Lock()
+        # Set while a code is waiting to be retrieved, so waiters can block
+        # on it instead of polling check_for_code
+        self.code_received = threading.Event()
 
     def set_auth_code(self, code):
         with self.lock:
             self.auth_code = code
+            self.code_received.set()
 
     def get_auth_code(self):
         with self.lock:
             code = self.auth_code
             self.auth_code = None  # Clear after retrieval
+            self.code_received.clear()
             return code
 
     def check_for_code(self):
         with self.lock:
             return self.auth_code is not None
 
+    def wait_for_code(self, timeout=None):
+        """Block until a code arrives or timeout seconds pass; True if one did."""
+        return self.code_received.wait(timeout)
+
 
 truelayer_code_store = TrueLayerCodeStore()
 
@@ -93,3 +102,8 @@ def get_truelayer_auth_code():
 def check_for_truelayer_code():
     """Checks if a TrueLayer authorization code is available."""
     return truelayer_code_store.check_for_code()
+
+
+def wait_for_truelayer_code(timeout=None):
+    """Waits up to timeout seconds for a TrueLayer authorization code."""
+    return truelayer_code_store.wait_for_code(timeout)
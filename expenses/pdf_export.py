@@ -1,8 +1,9 @@
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional, Sequence
 
+import numpy as np
 import pandas as pd
 from fpdf import FPDF
 
@@ -11,11 +12,25 @@ from expenses.config import EXPORTS_DIR
 from expenses.data_handler import load_category_types, get_category_spending_type
 
 
+# Abbreviated month names, Jan..Dec, for the monthly breakdown columns
+_MONTH_NAMES = tuple(datetime(2000, m, 1).strftime("%b") for m in range(1, 13))
+
+
 def format_currency(amount: float) -> str:
     """Format amount as currency string."""
     return f"${amount:,.2f}"
 
 
+def _format_currency_column(amounts: pd.Series) -> list[str]:
+    """Format a whole column of amounts as currency strings."""
+    return list(map(format_currency, amounts.tolist()))
+
+
+def _format_whole_amounts(amounts: pd.Series) -> list[str]:
+    """Format a column as whole amounts with separators, "-" for non-positive."""
+    return [f"{amount:,.0f}" if amount > 0 else "-" for amount in amounts.tolist()]
+
+
 def create_base_pdf(title: str) -> FPDF:
     """Create PDF with standard header styling."""
     pdf = FPDF(orientation="L", format="A4")
@@ -51,7 +66,7 @@ def add_section_title(pdf: FPDF, title: str) -> None:
 def add_table(
     pdf: FPDF,
     headers: list[str],
-    rows: list[list[str]],
+    rows: Iterable[Sequence[str]],
     col_widths: list[int],
     right_align: Optional[list[bool]] = None,
 ) -> None:
@@ -60,37 +75,56 @@ def add_table(
     Args:
         pdf: The FPDF instance.
         headers: Column header strings.
-        rows: List of row data (each row is a list of strings).
+        rows: Row data (each row a sequence of strings); read once, so a
+            generator works and its rows needn't all exist at the same time.
         col_widths: Width of each column in mm.
         right_align: Optional list of bools indicating right-alignment per column.
     """
     if right_align is None:
         right_align = [False] * len(headers)
+    aligns = ["R" if right else "L" for right in right_align]
 
     # Header row
     pdf.set_font("Helvetica", "B", 8)
     pdf.set_fill_color(50, 50, 50)
     pdf.set_text_color(255, 255, 255)
-    for i, header in enumerate(headers):
-        align = "R" if right_align[i] else "L"
-        pdf.cell(col_widths[i], 7, header, border=1, fill=True, align=align)
+    for width, header, align in zip(col_widths, headers, aligns):
+        pdf.cell(width, 7, header, border=1, fill=True, align=align)
     pdf.ln()
 
-    # Data rows
+    # Data rows; every other row is shaded, all in the same colour, so the
+    # style is set once rather than per row (a page break carries it over)
     pdf.set_font("Helvetica", "", 7)
     pdf.set_text_color(0, 0, 0)
+    pdf.set_fill_color(245, 245, 245)
+    cell = pdf.cell
     for row_idx, row in enumerate(rows):
         fill = row_idx % 2 == 1
-        if fill:
-            pdf.set_fill_color(245, 245, 245)
-        for i, cell in enumerate(row):
-            align = "R" if right_align[i] else "L"
-            pdf.cell(
-                col_widths[i], 6, str(cell), border=1, fill=fill, align=align
-            )
+        for width, value, align in zip(col_widths, row, aligns):
+            cell(width, 6, str(value), border=1, fill=fill, align=align)
         pdf.ln()
 
 
+def _top_categories(
+    df: pd.DataFrame, merchant_col: str, merchants: pd.Series
+) -> pd.Series:
+    """Each of merchants' most frequent category in df, "Other" if it has none.
+
+    Ties go to the category that sorts first, as with Series.mode(). One
+    grouped count over (merchant, category) replaces a mode() per merchant.
+    """
+    counts = df.groupby([merchant_col, "Category"], observed=True).size()
+    # Counts come out sorted by merchant then category; a stable sort on the
+    # count keeps that category order within ties
+    top = (
+        counts.sort_values(ascending=False, kind="stable")
+        .reset_index()
+        .drop_duplicates(merchant_col)
+        .set_index(merchant_col)["Category"]
+    )
+    return merchants.map(top).astype(object).fillna("Other")
+
+
 def _get_period_label(year: Optional[int], month: Optional[int]) -> str:
     """Build a human-readable period label."""
     if year and month:
@@ -106,6 +140,21 @@ def _ensure_exports_dir() -> Path:
     return EXPORTS_DIR
 
 
+def _prepare_transactions(transactions: pd.DataFrame) -> pd.DataFrame:
+    """Return a frame of transactions the exporter may add columns to.
+
+    A shallow copy: the exporters only add or replace whole columns, which
+    never writes through to the caller's frame, so its data isn't copied.
+    """
+    if transactions.empty:
+        raise ValueError("No transactions to export")
+
+    df = transactions.copy(deep=False)
+    if not pd.api.types.is_datetime64_any_dtype(df["Date"]):
+        df["Date"] = pd.to_datetime(df["Date"])
+    return df
+
+
 def export_summary_pdf(
     transactions: pd.DataFrame,
     categories: dict,
@@ -128,11 +177,7 @@ def export_summary_pdf(
     Returns: Path to generated PDF file
     """
     # Prepare data
-    df = transactions.copy()
-    if df.empty:
-        raise ValueError("No transactions to export")
-
-    df["Date"] = pd.to_datetime(df["Date"])
+    df = _prepare_transactions(transactions)
     if "Category" not in df.columns:
         df["Category"] = df["Merchant"].map(categories).fillna("Other")
 
@@ -149,6 +194,25 @@ def export_summary_pdf(
     if df.empty:
         raise ValueError("No transactions match the selected filters")
 
+    # The expense and income frames are row subsets of df, so both merchant
+    # tables use the same column
+    merchant_col = "DisplayMerchant" if "DisplayMerchant" in df.columns else "Merchant"
+
+    # The sections below group and compare on these columns again and again;
+    # as categoricals their strings are hashed once, here, and every groupby
+    # needs observed=True so categories absent from a slice don't show up
+    df = df.astype(
+        {col: "category" for col in ("Category", "Type", merchant_col) if col in df}
+    )
+
+    # Split by type once; the sections below all work from these
+    if "Type" in df.columns:
+        expense_df = df[df["Type"] == "expense"]
+        income_df = df[df["Type"] == "income"]
+    else:
+        expense_df = df
+        income_df = df.iloc[0:0]
+
     period_label = _get_period_label(year, month)
     pdf = create_base_pdf(f"Summary Report - {period_label}")
 
@@ -156,6 +220,12 @@ def export_summary_pdf(
     add_section_title(pdf, "CASH FLOW SUMMARY")
     totals = get_cash_flow_totals(df)
     category_types = load_category_types()
+    # Spending type of each expense category (and of "Other", which the
+    # merchant table falls back to), looked up once for all sections below
+    spending_types = {
+        cat: get_category_spending_type(cat, category_types)
+        for cat in [*expense_df["Category"].unique(), "Other"]
+    }
 
     cash_flow_rows = [
         ["Total Income", format_currency(totals["total_income"])],
@@ -165,19 +235,10 @@ def export_summary_pdf(
     ]
 
     # Calculate essential/discretionary breakdown
-    if "Type" in df.columns:
-        exp_df = df[df["Type"] == "expense"]
-    else:
-        exp_df = df
-    if not exp_df.empty and "Category" in exp_df.columns:
-        ess_total = 0.0
-        disc_total = 0.0
-        for _, r in exp_df.iterrows():
-            stype = get_category_spending_type(r["Category"], category_types)
-            if stype == "essential":
-                ess_total += r["Amount"]
-            else:
-                disc_total += r["Amount"]
+    if not expense_df.empty and "Category" in expense_df.columns:
+        is_essential = expense_df["Category"].map(spending_types) == "essential"
+        ess_total = float(expense_df.loc[is_essential, "Amount"].sum())
+        disc_total = float(expense_df.loc[~is_essential, "Amount"].sum())
         total_exp = ess_total + disc_total
         ess_pct = (ess_total / total_exp * 100) if total_exp > 0 else 0
         disc_pct = (disc_total / total_exp * 100) if total_exp > 0 else 0
@@ -210,15 +271,10 @@ def export_summary_pdf(
     pdf.ln(4)
 
     # --- Expense Categories ---
-    if "Type" in df.columns:
-        expense_df = df[df["Type"] == "expense"]
-    else:
-        expense_df = df
-
     if not expense_df.empty:
         add_section_title(pdf, "EXPENSE CATEGORIES")
         cat_summary = (
-            expense_df.groupby("Category")["Amount"]
+            expense_df.groupby("Category", observed=True)["Amount"]
             .sum()
             .sort_values(ascending=False)
             .reset_index()
@@ -226,12 +282,11 @@ def export_summary_pdf(
         total_expenses = cat_summary["Amount"].sum()
 
         expense_rows = []
-        for _, row in cat_summary.iterrows():
-            pct = (row["Amount"] / total_expenses * 100) if total_expenses > 0 else 0
-            stype = get_category_spending_type(row["Category"], category_types)
-            type_label = "Ess." if stype == "essential" else "Discr."
+        for category, amount in zip(cat_summary["Category"], cat_summary["Amount"]):
+            pct = (amount / total_expenses * 100) if total_expenses > 0 else 0
+            type_label = "Ess." if spending_types[category] == "essential" else "Discr."
             expense_rows.append(
-                [row["Category"], type_label, format_currency(row["Amount"]), f"{pct:.1f}%"]
+                [category, type_label, format_currency(amount), f"{pct:.1f}%"]
             )
         expense_rows.append(
             ["TOTAL", "", format_currency(total_expenses), "100.0%"]
@@ -246,62 +301,50 @@ def export_summary_pdf(
         pdf.ln(4)
 
     # --- Income Categories ---
-    if "Type" in df.columns:
-        income_df = df[df["Type"] == "income"]
-        if not income_df.empty:
-            add_section_title(pdf, "INCOME CATEGORIES")
-            income_cat = (
-                income_df.groupby("Category")["Amount"]
-                .sum()
-                .sort_values(ascending=False)
-                .reset_index()
-            )
-            total_income = income_cat["Amount"].sum()
-
-            income_rows = []
-            for _, row in income_cat.iterrows():
-                pct = (
-                    (row["Amount"] / total_income * 100) if total_income > 0 else 0
-                )
-                income_rows.append(
-                    [row["Category"], format_currency(row["Amount"]), f"{pct:.1f}%"]
-                )
-            income_rows.append(
-                ["TOTAL", format_currency(total_income), "100.0%"]
-            )
-            add_table(
-                pdf,
-                ["Category", "Amount", "%"],
-                income_rows,
-                [80, 50, 30],
-                [False, True, True],
-            )
-            pdf.ln(4)
+    if not income_df.empty:
+        add_section_title(pdf, "INCOME CATEGORIES")
+        income_cat = (
+            income_df.groupby("Category", observed=True)["Amount"]
+            .sum()
+            .sort_values(ascending=False)
+            .reset_index()
+        )
+        total_income = income_cat["Amount"].sum()
+
+        income_rows = []
+        for category, amount in zip(income_cat["Category"], income_cat["Amount"]):
+            pct = (amount / total_income * 100) if total_income > 0 else 0
+            income_rows.append([category, format_currency(amount), f"{pct:.1f}%"])
+        income_rows.append(
+            ["TOTAL", format_currency(total_income), "100.0%"]
+        )
+        add_table(
+            pdf,
+            ["Category", "Amount", "%"],
+            income_rows,
+            [80, 50, 30],
+            [False, True, True],
+        )
+        pdf.ln(4)
 
     # --- Top 10 Expense Merchants ---
     if not expense_df.empty:
         add_section_title(pdf, "TOP EXPENSE MERCHANTS")
-        merchant_col = (
-            "DisplayMerchant" if "DisplayMerchant" in expense_df.columns else "Merchant"
-        )
-        merchant_summary = (
-            expense_df.groupby(merchant_col, as_index=False)
-            .agg(
-                {
-                    "Amount": "sum",
-                    "Category": lambda x: x.mode()[0] if len(x.mode()) > 0 else "Other",
-                }
-            )
-            .sort_values("Amount", ascending=False)
-            .head(10)
+        merchant_summary = expense_df.groupby(
+            merchant_col, as_index=False, observed=True
+        ).agg({"Amount": "sum"})
+        merchant_summary["Category"] = _top_categories(
+            expense_df, merchant_col, merchant_summary[merchant_col]
         )
+        merchant_summary = merchant_summary.sort_values("Amount", ascending=False).head(10)
         merchant_rows = []
-        for _, row in merchant_summary.iterrows():
-            stype = get_category_spending_type(row["Category"], category_types)
-            type_label = "Ess." if stype == "essential" else "Discr."
-            merchant_rows.append(
-                [row[merchant_col], row["Category"], type_label, format_currency(row["Amount"])]
-            )
+        for merchant, category, amount in zip(
+            merchant_summary[merchant_col],
+            merchant_summary["Category"],
+            _format_currency_column(merchant_summary["Amount"]),
+        ):
+            type_label = "Ess." if spending_types[category] == "essential" else "Discr."
+            merchant_rows.append([merchant, category, type_label, amount])
         add_table(
             pdf,
             ["Merchant", "Category", "Type", "Amount"],
@@ -312,61 +355,53 @@ def export_summary_pdf(
         pdf.ln(4)
 
     # --- Top 10 Income Sources ---
-    if "Type" in df.columns:
-        income_df = df[df["Type"] == "income"]
-        if not income_df.empty:
-            add_section_title(pdf, "TOP INCOME SOURCES")
-            merchant_col = (
-                "DisplayMerchant"
-                if "DisplayMerchant" in income_df.columns
-                else "Merchant"
-            )
-            income_merchant = (
-                income_df.groupby(merchant_col, as_index=False)
-                .agg(
-                    {
-                        "Amount": "sum",
-                        "Category": lambda x: (
-                            x.mode()[0] if len(x.mode()) > 0 else "Other"
-                        ),
-                    }
-                )
-                .sort_values("Amount", ascending=False)
-                .head(10)
-            )
-            income_source_rows = [
-                [row[merchant_col], row["Category"], format_currency(row["Amount"])]
-                for _, row in income_merchant.iterrows()
-            ]
-            add_table(
-                pdf,
-                ["Source", "Category", "Amount"],
-                income_source_rows,
-                [90, 50, 50],
-                [False, False, True],
+    if not income_df.empty:
+        add_section_title(pdf, "TOP INCOME SOURCES")
+        income_merchant = income_df.groupby(
+            merchant_col, as_index=False, observed=True
+        ).agg({"Amount": "sum"})
+        income_merchant["Category"] = _top_categories(
+            income_df, merchant_col, income_merchant[merchant_col]
+        )
+        income_merchant = income_merchant.sort_values("Amount", ascending=False).head(10)
+        income_source_rows = [
+            list(row)
+            for row in zip(
+                income_merchant[merchant_col],
+                income_merchant["Category"],
+                _format_currency_column(income_merchant["Amount"]),
             )
-            pdf.ln(4)
+        ]
+        add_table(
+            pdf,
+            ["Source", "Category", "Amount"],
+            income_source_rows,
+            [90, 50, 50],
+            [False, False, True],
+        )
+        pdf.ln(4)
 
     # --- Monthly Breakdown (only for yearly view, not monthly) ---
     if year and not month and not expense_df.empty:
         add_section_title(pdf, "MONTHLY EXPENSE BREAKDOWN")
-        monthly = expense_df.pivot_table(
-            index="Category",
-            columns=expense_df["Date"].dt.month,
-            values="Amount",
-            aggfunc="sum",
-            fill_value=0,
+        month_names = list(_MONTH_NAMES)
+        # One hashed groupby, then every month as a column in calendar order
+        # (months without spending filled with 0)
+        monthly = (
+            expense_df.groupby(
+                ["Category", expense_df["Date"].dt.month], observed=True
+            )["Amount"]
+            .sum()
+            .unstack(fill_value=0)
+            .reindex(columns=range(1, 13), fill_value=0)
+            .set_axis(month_names, axis=1)
         )
-        for m in range(1, 13):
-            if m not in monthly.columns:
-                monthly[m] = 0
-        monthly = monthly[sorted(monthly.columns)]
-
-        month_names = [datetime(2000, m, 1).strftime("%b") for m in range(1, 13)]
-        monthly.columns = month_names
-        monthly["Total"] = monthly.sum(axis=1)
-        non_zero = (monthly[month_names] > 0).sum(axis=1)
-        monthly["Avg"] = monthly["Total"].divide(non_zero).fillna(0)
+        # Average over the months with spending, 0 if there were none
+        amounts = monthly.to_numpy()
+        totals = amounts.sum(axis=1)
+        non_zero = (amounts > 0).sum(axis=1)
+        monthly["Total"] = totals
+        monthly["Avg"] = np.where(non_zero > 0, totals / np.maximum(non_zero, 1), 0.0)
         monthly = monthly.sort_values("Total", ascending=False)
 
         headers = ["Category", "Type"] + month_names + ["Total", "Avg"]
@@ -379,26 +414,27 @@ def export_summary_pdf(
         col_widths = [cat_w, type_w] + [month_w] * 12 + [total_w, avg_w]
         right_align = [False, False] + [True] * 14
 
+        # Format column by column, then read the table off row by row
+        month_cells = [_format_whole_amounts(monthly[mn]) for mn in month_names]
+        total_cells = [f"{val:,.0f}" for val in monthly["Total"].tolist()]
+        avg_cells = [f"{val:,.0f}" for val in monthly["Avg"].tolist()]
         monthly_rows = []
-        for cat_name, row in monthly.iterrows():
-            stype = get_category_spending_type(str(cat_name), category_types)
-            type_label = "Ess." if stype == "essential" else "Discr."
-            cells = [str(cat_name), type_label]
-            for mn in month_names:
-                val = row[mn]
-                cells.append(f"{val:,.0f}" if val > 0 else "-")
-            cells.append(f"{row['Total']:,.0f}")
-            cells.append(f"{row['Avg']:,.0f}")
-            monthly_rows.append(cells)
+        for i, cat_name in enumerate(monthly.index):
+            type_label = "Ess." if spending_types[cat_name] == "essential" else "Discr."
+            monthly_rows.append(
+                [str(cat_name), type_label]
+                + [cells[i] for cells in month_cells]
+                + [total_cells[i], avg_cells[i]]
+            )
 
         # Total row
-        total_cells = ["TOTAL", ""]
-        for mn in month_names:
-            val = monthly[mn].sum()
-            total_cells.append(f"{val:,.0f}" if val > 0 else "-")
-        total_cells.append(f"{monthly['Total'].sum():,.0f}")
-        total_cells.append(f"{monthly['Total'].sum() / 12:,.0f}")
-        monthly_rows.insert(0, total_cells)
+        grand_total = monthly["Total"].sum()
+        monthly_rows.insert(
+            0,
+            ["TOTAL", ""]
+            + _format_whole_amounts(monthly[month_names].sum())
+            + [f"{grand_total:,.0f}", f"{grand_total / 12:,.0f}"],
+        )
 
         add_table(pdf, headers, monthly_rows, col_widths, right_align)
 
@@ -434,11 +470,7 @@ def export_transactions_pdf(
 
     Returns: Path to generated PDF file
     """
-    df = transactions.copy()
-    if df.empty:
-        raise ValueError("No transactions to export")
-
-    df["Date"] = pd.to_datetime(df["Date"])
+    df = _prepare_transactions(transactions)
     if categories and "Category" not in df.columns:
         df["Category"] = df["Merchant"].map(categories).fillna("Other")
     elif "Category" not in df.columns:
@@ -477,15 +509,18 @@ def export_transactions_pdf(
     # Sort by date descending
     df = df.sort_values("Date", ascending=False)
 
-    tx_rows = []
-    for _, row in df.iterrows():
-        date_str = row["Date"].strftime("%Y-%m-%d") if pd.notna(row["Date"]) else ""
-        merchant = str(row.get(merchant_col, row.get("Merchant", ""))) or ""
-        amount = f"{row['Amount']:,.2f}" if pd.notna(row["Amount"]) else ""
-        tx_type = str(row.get("Type", "expense")).capitalize()
-        category = str(row.get("Category", "Other"))
-        source = str(row.get("Source", "Unknown")) or "Unknown"
-        tx_rows.append([date_str, merchant, amount, tx_type, category, source])
+    # Format each column in one pass, then zip the columns into rows
+    dates = df["Date"].dt.strftime("%Y-%m-%d").fillna("")
+    merchants = df[merchant_col].astype(str)
+    amounts = [f"{amount:,.2f}" if pd.notna(amount) else "" for amount in df["Amount"]]
+    tx_types = df["Type"].astype(str).str.capitalize()
+    tx_categories = df["Category"].astype(str)
+    if "Source" in df.columns:
+        sources = df["Source"].astype(str).replace("", "Unknown")
+    else:
+        sources = ["Unknown"] * len(df)
+    # Rows are zipped up as the table is drawn rather than all held in a list
+    tx_rows = zip(dates, merchants, amounts, tx_types, tx_categories, sources)
 
     # Landscape A4: ~277mm usable width
     tx_widths = [22, 80, 30, 20, 40, 60]
@@ -501,26 +536,23 @@ def export_transactions_pdf(
 
     # --- Merchant Summary ---
     add_section_title(pdf, "MERCHANT SUMMARY")
-    merchant_agg = (
-        df.groupby(merchant_col, as_index=False)
-        .agg(
-            {
-                "Amount": ["sum", "count"],
-                "Category": lambda x: x.mode()[0] if len(x.mode()) > 0 else "Other",
-            }
-        )
+    merchant_agg = df.groupby(merchant_col, as_index=False).agg(
+        {"Amount": ["sum", "count"]}
+    )
+    merchant_agg.columns = ["Merchant", "Total", "Count"]
+    merchant_agg["Category"] = _top_categories(
+        df, merchant_col, merchant_agg["Merchant"]
     )
-    merchant_agg.columns = ["Merchant", "Total", "Count", "Category"]
     merchant_agg = merchant_agg.sort_values("Total", ascending=False)
 
     merch_rows = [
-        [
-            row["Merchant"],
-            format_currency(row["Total"]),
-            str(int(row["Count"])),
-            row["Category"],
-        ]
-        for _, row in merchant_agg.iterrows()
+        list(row)
+        for row in zip(
+            merchant_agg["Merchant"],
+            _format_currency_column(merchant_agg["Total"]),
+            merchant_agg["Count"].astype(int).astype(str),
+            merchant_agg["Category"],
+        )
     ]
     add_table(
         pdf,
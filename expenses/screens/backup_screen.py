@@ -63,8 +63,11 @@ class BackupScreen(BaseScreen):
 
     def refresh_backup_list(self) -> None:
         """Refresh the list of available backups and statistics."""
+        # List the backup directory once for both the statistics and the table
+        backups = list_backups()
+
         # Update statistics
-        stats = get_backup_stats()
+        stats = get_backup_stats(backups)
         stats_text = (
             f"Total Backups: {stats['count']} | "
             f"Total Size: {self._format_size(stats['total_size'])}"
@@ -95,8 +98,6 @@ class BackupScreen(BaseScreen):
         table.add_column("Size", width=15)
         table.add_column("File", width=None)
 
-        backups = list_backups()
-
         if not backups:
             table.add_row("No backups available", "", "")
             self.query_one("#restore_button", Button).disabled = True
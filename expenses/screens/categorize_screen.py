@@ -94,7 +94,7 @@ class CategorizeScreen(BaseScreen, DataTableOperationsMixin):
 
     def load_data_and_update_display(self) -> None:
         """Load data and update the merchant list and categorization view."""
-        self.transactions = load_transactions_from_parquet()
+        self.transactions = load_transactions_from_parquet(columns=["Merchant"])
         saved_categories = load_categories()
         merchant_aliases = load_merchant_aliases()
 
@@ -155,11 +155,13 @@ class BuildDeleteScreen(BaseScreen):
         table.add_columns("Date", "Merchant", "Amount")
 
         if not self.preview_df.empty:
-            for _, row in self.preview_df.iterrows():
+            for date, merchant, amount in self.preview_df[
+                ["Date", "Merchant", "Amount"]
+            ].itertuples(index=False, name=None):
                 table.add_row(
-                    row["Date"].strftime("%Y-%m-%d"),
-                    row["Merchant"],
-                    f"{row['Amount']:,.2f}",
+                    date.strftime("%Y-%m-%d"),
+                    merchant,
+                    f"{amount:,.2f}",
                 )
             total_amount = self.preview_df["Amount"].sum()
             count = len(self.preview_df)
@@ -1,5 +1,8 @@
+import csv
 import logging
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from textual.app import ComposeResult
 from textual.widgets import Button, Static, Input, DataTable, Select, Checkbox
 from textual.containers import Vertical, VerticalScroll
@@ -135,7 +138,7 @@ class ImportScreen(BaseScreen):
             return
 
         try:
-            self.df = pd.read_csv(self.file_path)
+            self.df = self._read_csv(self.file_path)
             preview_df = self.df.head(5)
             table = self.query_one("#file_preview", DataTable)
             table.clear(columns=True)
@@ -165,6 +168,31 @@ class ImportScreen(BaseScreen):
         except Exception as e:
             logging.error(f"Error loading file: {e}")
 
+    @staticmethod
+    def _read_csv(path: str) -> pd.DataFrame:
+        """Read a CSV with pyarrow's multithreaded parser.
+
+        Every column is read as text, as written in the file: left to infer
+        types, pyarrow turns ISO date columns into Timestamps (previewed as
+        "YYYY-MM-DD 00:00:00") and reformats amounts, while _parse_date_smart
+        and clean_amount parse both from text anyway. Falls back to pandas'
+        C parser for files pyarrow rejects (e.g. ragged rows or odd quoting),
+        which it is more lenient about.
+        """
+        try:
+            # pandas' pyarrow engine applies dtype only after inferring types,
+            # so the header is read first to pin every column to string
+            with open(path, newline="", encoding="utf-8-sig") as f:
+                header = next(csv.reader(f), [])
+            convert_options = pacsv.ConvertOptions(
+                column_types={name: pa.string() for name in header},
+                strings_can_be_null=True,
+            )
+            return pacsv.read_csv(path, convert_options=convert_options).to_pandas()
+        except Exception as e:
+            logging.debug(f"pyarrow CSV parser failed ({e}), retrying with C parser")
+            return pd.read_csv(path, dtype=str)
+
     def _parse_date_smart(self, date_str: str) -> pd.Timestamp:
         """Smart date parsing that detects format automatically."""
         date_str = str(date_str).strip()
@@ -204,18 +232,19 @@ class ImportScreen(BaseScreen):
         row,
         date_col,
         merchant_col,
-        amount_col,
+        amount_in_val,
         type_mode,
         skip_counts,
-        amount_out_col=None,
+        amount_out_val=None,
     ):
         """Process a single row from the CSV.
 
-        If amount_out_col is provided (dual-column mode), the amount_col is treated
-        as "money in" (income) and amount_out_col as "money out" (expenses).
+        Amounts are passed in already cleaned (see import_data). If amount_out_val
+        is provided (dual-column mode), amount_in_val is treated as "money in"
+        (income) and amount_out_val as "money out" (expenses).
         """
         logging.debug(f"Processing row {index}")
-        logging.debug(f"Raw row data: {row.to_dict()}")
+        logging.debug(f"Raw row data: {row}")
 
         # Parse date
         date_val = self._parse_date_smart(row[date_col])
@@ -231,10 +260,9 @@ class ImportScreen(BaseScreen):
             return None
 
         # Parse amount - handle dual-column mode
-        if amount_out_col:
+        dual_column = amount_out_val is not None
+        if dual_column:
             # Dual-column mode: separate columns for money in/out
-            amount_in_val = clean_amount(pd.Series([row[amount_col]]))[0]
-            amount_out_val = clean_amount(pd.Series([row[amount_out_col]]))[0]
             logging.debug(
                 f"Row {index}: Dual-column - in: {amount_in_val}, out: {amount_out_val}"
             )
@@ -267,7 +295,7 @@ class ImportScreen(BaseScreen):
                 return None
         else:
             # Single-column mode (original behavior)
-            amount_val = clean_amount(pd.Series([row[amount_col]]))[0]
+            amount_val = amount_in_val
             logging.debug(f"Row {index}: Cleaned amount: {amount_val}")
 
             # Skip zero amounts
@@ -289,7 +317,7 @@ class ImportScreen(BaseScreen):
 
         # Special PayPal check - only for auto mode with expenses (single-column only)
         if (
-            not amount_out_col
+            not dual_column
             and type_mode == "auto"
             and self._should_skip_paypal_row(row)
         ):
@@ -371,17 +399,28 @@ class ImportScreen(BaseScreen):
             else:
                 logging.info(f"Starting CSV import with type mode: {type_mode}...")
 
+            # Clean the amount columns in one vectorized pass, not once per row
+            amounts_in = clean_amount(self.df[amount_col]).tolist()
+            if amount_out_col:
+                amounts_out = clean_amount(self.df[amount_out_col]).tolist()
+            else:
+                amounts_out = [None] * len(self.df)
+
             # Process each row
-            for index, row in self.df.iterrows():
+            # Rows as plain dicts; building a Series per row costs more than
+            # the row's own processing
+            for index, row, amount_in_val, amount_out_val in zip(
+                self.df.index, self.df.to_dict("records"), amounts_in, amounts_out
+            ):
                 transaction = self._process_row(
                     index,
                     row,
                     date_col,
                     merchant_col,
-                    amount_col,
+                    amount_in_val,
                     type_mode,
                     skip_counts,
-                    amount_out_col,
+                    amount_out_val,
                 )
                 if transaction:
                     transactions_to_append.append(transaction)
@@ -202,7 +202,7 @@ class PayslipsScreen(BaseScreen):
         table = self.query_one("#payslip_preview", DataTable)
         table.clear(columns=True)
         table.add_columns("Month", "Gross", "Net", "EE Pens", "ER Pens", "Flag")
-        for _, row in df.iterrows():
+        for row in df.to_dict("records"):
             flags = [] if row["YTDReconciled"] else ["⚠ YTD"]
             if not row.get("NetReconciled", True):
                 flags.append("⚠ NET")
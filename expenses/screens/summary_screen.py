@@ -184,10 +184,11 @@ class SummaryScreen(BaseScreen, DataTableOperationsMixin):
             if len(self.merchant_aliases) > 0:
                 sample_size = min(5, len(self._all_transactions))
                 logging.debug("Sample after applying aliases:")
-                for idx, row in self._all_transactions.head(sample_size).iterrows():
-                    logging.debug(
-                        f"  '{row['Merchant']}' -> '{row['DisplayMerchant']}'"
-                    )
+                sample = self._all_transactions.head(sample_size)
+                for merchant, display_merchant in zip(
+                    sample["Merchant"], sample["DisplayMerchant"]
+                ):
+                    logging.debug(f"  '{merchant}' -> '{display_merchant}'")
             self._all_transactions["Category"] = (
                 self._all_transactions["DisplayMerchant"]
                 .map(self.categories)
@@ -540,7 +541,7 @@ class SummaryScreen(BaseScreen, DataTableOperationsMixin):
 
     def action_pick_excluded_tags(self) -> None:
         """Open the tag-exclusion picker (Shift+X)."""
-        full_df = load_transactions_from_parquet()
+        full_df = load_transactions_from_parquet(columns=["Tags"])
         if not full_df.empty and "Tags" in full_df.columns:
             tags_in_use = all_tags_in_series(full_df["Tags"])
             namespaces = namespaces_in_series(full_df["Tags"])
@@ -747,17 +748,18 @@ class SummaryScreen(BaseScreen, DataTableOperationsMixin):
             total = category_summary["Amount"].sum()
             max_amount = category_summary["Amount"].max()
             selected_style = Style(bgcolor="yellow", color="black")
-            for _, row in category_summary.iterrows():
-                category = row["Category"]
+            for category, amount in zip(
+                category_summary["Category"], category_summary["Amount"]
+            ):
                 style = selected_style if category in self.selected_rows else ""
-                percentage = (row["Amount"] / total) * 100 if total > 0 else 0
-                bar = self._get_spending_bar(row["Amount"], max_amount, bar_length=25)
+                percentage = (amount / total) * 100 if total > 0 else 0
+                bar = self._get_spending_bar(amount, max_amount, bar_length=25)
                 stype = get_category_spending_type(category, self.category_types)
                 type_label = "Ess." if stype == "essential" else "Discr."
                 styled_row = [
                     Text(category, style=style),
                     Text(type_label, style=style),
-                    Text(f"{row['Amount']:,.2f}", style=style),
+                    Text(f"{amount:,.2f}", style=style),
                     Text(f"{percentage:.2f}%", style=style),
                     bar,
                 ]
@@ -795,17 +797,18 @@ class SummaryScreen(BaseScreen, DataTableOperationsMixin):
             total = category_summary["Amount"].sum()
             max_amount = category_summary["Amount"].max()
             selected_style = Style(bgcolor="yellow", color="black")
-            for _, row in category_summary.iterrows():
-                category = row["Category"]
+            for category, amount in zip(
+                category_summary["Category"], category_summary["Amount"]
+            ):
                 style = selected_style if category in self.selected_rows else ""
-                percentage = (row["Amount"] / total) * 100 if total > 0 else 0
-                bar = self._get_spending_bar(row["Amount"], max_amount, bar_length=25)
+                percentage = (amount / total) * 100 if total > 0 else 0
+                bar = self._get_spending_bar(amount, max_amount, bar_length=25)
                 stype = get_category_spending_type(category, self.category_types)
                 type_label = "Ess." if stype == "essential" else "Discr."
                 styled_row = [
                     Text(category, style=style),
                     Text(type_label, style=style),
-                    Text(f"{row['Amount']:,.2f}", style=style),
+                    Text(f"{amount:,.2f}", style=style),
                     Text(f"{percentage:.2f}%", style=style),
                     bar,  # Plain string, no Text() wrapper, no style
                 ]
@@ -863,10 +866,9 @@ class SummaryScreen(BaseScreen, DataTableOperationsMixin):
                 f"Top merchants summary has {len(merchant_summary)} unique display merchants"
             )
 
-            for _, row in merchant_summary.iterrows():
-                display_merchant = row["DisplayMerchant"]
-                amount = row["Amount"]
-                category = row["Category"]
+            for display_merchant, amount, category in merchant_summary[
+                ["DisplayMerchant", "Amount", "Category"]
+            ].itertuples(index=False, name=None):
                 stype = get_category_spending_type(category, self.category_types)
                 type_label = "Ess." if stype == "essential" else "Discr."
                 table.add_row(
@@ -957,13 +959,14 @@ class SummaryScreen(BaseScreen, DataTableOperationsMixin):
         discretionary_total = 0.0
 
         if "Category" in expense_df.columns:
-            for _, row in expense_df.iterrows():
-                cat = row["Category"]
-                stype = get_category_spending_type(cat, self.category_types)
-                if stype == "essential":
-                    essential_total += row["Amount"]
-                else:
-                    discretionary_total += row["Amount"]
+            # One spending-type lookup per distinct category, not per row
+            spending_types = {
+                cat: get_category_spending_type(cat, self.category_types)
+                for cat in expense_df["Category"].unique()
+            }
+            is_essential = expense_df["Category"].map(spending_types) == "essential"
+            essential_total = float(expense_df.loc[is_essential, "Amount"].sum())
+            discretionary_total = float(expense_df.loc[~is_essential, "Amount"].sum())
         else:
             discretionary_total = expense_df["Amount"].sum()
 
@@ -1034,14 +1037,15 @@ class SummaryScreen(BaseScreen, DataTableOperationsMixin):
             total = category_summary["Amount"].sum()
             max_amount = category_summary["Amount"].max()
             selected_style = Style(bgcolor="yellow", color="black")
-            for _, row in category_summary.iterrows():
-                category = row["Category"]
+            for category, amount in zip(
+                category_summary["Category"], category_summary["Amount"]
+            ):
                 style = selected_style if category in self.selected_rows else ""
-                percentage = (row["Amount"] / total) * 100 if total > 0 else 0
-                bar = self._get_spending_bar(row["Amount"], max_amount, bar_length=25)
+                percentage = (amount / total) * 100 if total > 0 else 0
+                bar = self._get_spending_bar(amount, max_amount, bar_length=25)
                 styled_row = [
                     Text(category, style=style),
-                    Text(f"{row['Amount']:,.2f}", style=style),
+                    Text(f"{amount:,.2f}", style=style),
                     Text(f"{percentage:.2f}%", style=style),
                     bar,
                 ]
@@ -1088,14 +1092,15 @@ class SummaryScreen(BaseScreen, DataTableOperationsMixin):
             total = category_summary["Amount"].sum()
             max_amount = category_summary["Amount"].max()
             selected_style = Style(bgcolor="yellow", color="black")
-            for _, row in category_summary.iterrows():
-                category = row["Category"]
+            for category, amount in zip(
+                category_summary["Category"], category_summary["Amount"]
+            ):
                 style = selected_style if category in self.selected_rows else ""
-                percentage = (row["Amount"] / total) * 100 if total > 0 else 0
-                bar = self._get_spending_bar(row["Amount"], max_amount, bar_length=25)
+                percentage = (amount / total) * 100 if total > 0 else 0
+                bar = self._get_spending_bar(amount, max_amount, bar_length=25)
                 styled_row = [
                     Text(category, style=style),
-                    Text(f"{row['Amount']:,.2f}", style=style),
+                    Text(f"{amount:,.2f}", style=style),
                     Text(f"{percentage:.2f}%", style=style),
                     bar,
                 ]
@@ -1154,10 +1159,9 @@ class SummaryScreen(BaseScreen, DataTableOperationsMixin):
                 .sort_values("Amount", ascending=False)
             )
 
-            for _, row in merchant_summary.iterrows():
-                display_merchant = row["DisplayMerchant"]
-                amount = row["Amount"]
-                category = row["Category"]
+            for display_merchant, amount, category in merchant_summary[
+                ["DisplayMerchant", "Amount", "Category"]
+            ].itertuples(index=False, name=None):
                 table.add_row(
                     display_merchant,
                     category,
@@ -1290,7 +1294,9 @@ class SummaryScreen(BaseScreen, DataTableOperationsMixin):
                 "-": Style(),
             }
 
-            for category_name, row in monthly_summary.iterrows():
+            for category_name, row in zip(
+                monthly_summary.index, monthly_summary.to_dict("records")
+            ):
                 style = (
                     selected_style
                     if category_name in self.selected_rows
@@ -1357,7 +1363,9 @@ class SummaryScreen(BaseScreen, DataTableOperationsMixin):
 
             # Add category rows
             selected_style = Style(bgcolor="yellow", color="black")
-            for category_name, row in monthly_summary.iterrows():
+            for category_name, row in zip(
+                monthly_summary.index, monthly_summary.to_dict("records")
+            ):
                 style = (
                     selected_style
                     if category_name in self.selected_rows
@@ -413,7 +413,8 @@ class TransactionScreen(BaseScreen, DataTableOperationsMixin):
         selected_style = Style(bgcolor="yellow", color="black")
         income_style = Style(color="green")
         expense_style = Style(color="white")
-        for i, row in self.display_df.iterrows():
+        # Plain dicts per row (same .get() lookups) rather than a Series each
+        for i, row in zip(self.display_df.index, self.display_df.to_dict("records")):
             is_income = row.get("Type", "expense") == "income"
             if i in self.selected_rows:
                 style = selected_style
@@ -487,13 +488,15 @@ class TransactionScreen(BaseScreen, DataTableOperationsMixin):
         merchant_table.add_column("Category", width=20)
 
         # Add rows
-        for _, row in merchant_summary.iterrows():
+        for merchant, total, count, tx_type, category in merchant_summary[
+            ["Merchant", "Total", "Count", "Type", "Category"]
+        ].itertuples(index=False, name=None):
             merchant_table.add_row(
-                row["Merchant"] or "",
-                f"{row['Total']:,.2f}",
-                str(int(row["Count"])),
-                row["Type"] or "Expense",
-                row["Category"] or "",
+                merchant or "",
+                f"{total:,.2f}",
+                str(int(count)),
+                tx_type or "Expense",
+                category or "",
             )
 
     _FILTER_INPUT_IDS = (
@@ -6,8 +6,7 @@ import urllib.parse
 from textual.app import ComposeResult
 from textual.widgets import Static, Button, DataTable, Checkbox
 from textual.containers import Vertical, VerticalScroll, Container, Horizontal
-from textual.timer import Timer
-from textual.worker import Worker, WorkerState
+from textual.worker import Worker, WorkerState, get_current_worker
 
 import pandas as pd
 
@@ -38,7 +37,7 @@ from expenses.screens.manage_truelayer_connections_screen import (
 from expenses.oauth_server import (
     run_oauth_server,
     get_truelayer_auth_code,
-    check_for_truelayer_code,
+    wait_for_truelayer_code,
 )
 
 
@@ -47,7 +46,7 @@ class TrueLayerScreen(BaseScreen):
 
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
-        self.code_check_timer: Timer | None = None
+        self.code_wait_worker: Worker | None = None
         self.pending_transactions: pd.DataFrame | None = None
         self.pending_connection_id: str | None = None
         self.pending_provider_name: str | None = None
@@ -124,9 +123,9 @@ class TrueLayerScreen(BaseScreen):
         self._update_connections_view()
 
     def on_unmount(self) -> None:
-        """Stop the code check timer when the screen is closed."""
-        if self.code_check_timer:
-            self.code_check_timer.stop()
+        """Stop waiting for an authorization code when the screen is closed."""
+        if self.code_wait_worker:
+            self.code_wait_worker.cancel()
 
     def _check_credentials(self) -> None:
         """Checks if TrueLayer credentials are configured."""
@@ -279,7 +278,13 @@ class TrueLayerScreen(BaseScreen):
             self.app.show_notification(
                 "Browser opened for TrueLayer authentication.", timeout=5
             )
-            self.code_check_timer = self.set_interval(1, self.check_for_auth_code)
+            self.code_wait_worker = self.run_worker(
+                self._wait_for_auth_code_worker,
+                exclusive=True,
+                thread=True,
+                group="auth_code",
+                name="_wait_for_auth_code_worker",
+            )
 
         except Exception as e:
             logging.error(f"Error starting TrueLayer OAuth flow: {e}")
@@ -301,16 +306,22 @@ class TrueLayerScreen(BaseScreen):
                 "Permissions expired. Please reconnect your bank account.", timeout=10
             )
 
-    async def check_for_auth_code(self) -> None:
-        """Periodically check if the authorization code has been received."""
-        if check_for_truelayer_code():
-            if self.code_check_timer:
-                self.code_check_timer.stop()
+    def _wait_for_auth_code_worker(self) -> None:
+        """Wait in a background thread for the callback server to get a code."""
+        worker = get_current_worker()
+        # Wake up every second only to notice the wait being cancelled; the
+        # code itself is picked up as soon as the callback stores it
+        while not worker.is_cancelled:
+            if wait_for_truelayer_code(timeout=1):
+                self.app.call_from_thread(self.check_for_auth_code)
+                return
 
-            auth_code = get_truelayer_auth_code()
-            if auth_code:
-                logging.info("Authorization code retrieved from callback server.")
-                await self._exchange_auth_code(auth_code)
+    async def check_for_auth_code(self) -> None:
+        """Exchange the authorization code once the callback has received it."""
+        auth_code = get_truelayer_auth_code()
+        if auth_code:
+            logging.info("Authorization code retrieved from callback server.")
+            await self._exchange_auth_code(auth_code)
 
     async def _exchange_auth_code(self, code: str) -> None:
         """Exchanges the authorization code for access and refresh tokens."""
@@ -605,6 +616,7 @@ class TrueLayerScreen(BaseScreen):
             display_columns.append("AccountSource")
 
         preview_df = df[display_columns].copy()
+        preview_df["Date"] = preview_df["Date"].dt.strftime("%Y-%m-%d")
 
         # Add columns to table
         table.add_columns(*display_columns)
@@ -1,5 +1,7 @@
+import hashlib
 import json
 import logging
+import threading
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
 
@@ -14,13 +16,20 @@ from expenses.config import (
 )
 from expenses.data_handler import (
     append_transactions,
-    _set_secure_permissions,
+    _atomic_write,
     _ensure_secure_config_dir,
+    _is_unchanged,
+    _remember_saved,
 )
 
 
 TRUELAYER_CONNECTIONS_FILE = CONFIG_DIR / "truelayer_connections.json"
 
+# Session shared by all TrueLayer calls, so fetching each account of a sync
+# reuses its pooled HTTPS connections instead of opening new ones
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
 
 class ScaExceededError(Exception):
     """Custom exception for SCA exemption expired errors."""
@@ -44,18 +53,21 @@ def _get_auth_base_url() -> str:
 
 
 def _initialize_truelayer_session() -> requests.Session | None:
-    """Initializes a requests session for TrueLayer API calls."""
+    """Returns the requests session for TrueLayer API calls, creating it once."""
+    global _session
     if not TRUELAYER_CLIENT_ID or not TRUELAYER_CLIENT_SECRET:
         logging.error("TrueLayer API credentials not found.")
         return None
 
-    session = requests.Session()
-    session.headers.update(
-        {
-            "Content-Type": "application/json",
-        }
-    )
-    return session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            _session.headers.update(
+                {
+                    "Content-Type": "application/json",
+                }
+            )
+        return _session
 
 
 def load_truelayer_connections() -> List[Dict[str, Any]]:
@@ -75,6 +87,26 @@ def load_truelayer_connections() -> List[Dict[str, Any]]:
         return []
 
 
+def _write_truelayer_connections(connections: List[Dict[str, Any]]) -> None:
+    """
+    Writes the connections list to the truelayer_connections.json file.
+
+    The file holds access and refresh tokens, so it is replaced atomically
+    (owner-only, never left truncated) and not rewritten if unchanged.
+
+    Raises:
+        OSError: If the file could not be written.
+    """
+    payload = json.dumps(connections, indent=4)
+    digest = hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+    if _is_unchanged(TRUELAYER_CONNECTIONS_FILE, digest):
+        logging.debug("TrueLayer connections unchanged, skipping rewrite")
+        return
+
+    _atomic_write(TRUELAYER_CONNECTIONS_FILE, lambda tmp: tmp.write_text(payload))
+    _remember_saved(TRUELAYER_CONNECTIONS_FILE, digest)
+
+
 def save_truelayer_connection(connection: Dict[str, Any]) -> None:
     """
     Saves a new TrueLayer connection to the truelayer_connections.json file.
@@ -94,9 +126,7 @@ def save_truelayer_connection(connection: Dict[str, Any]) -> None:
 
     connections.append(connection_to_save)
     try:
-        with open(TRUELAYER_CONNECTIONS_FILE, "w") as f:
-            json.dump(connections, f, indent=4)
-        _set_secure_permissions(TRUELAYER_CONNECTIONS_FILE)
+        _write_truelayer_connections(connections)
         logging.debug(
             f"Successfully saved new TrueLayer connection: {connection_to_save.get('provider_id')}"
         )
@@ -133,9 +163,7 @@ def update_truelayer_connection(updated_connection: Dict[str, Any]) -> None:
         connections.append(updated_connection)
 
     try:
-        with open(TRUELAYER_CONNECTIONS_FILE, "w") as f:
-            json.dump(connections, f, indent=4)
-        _set_secure_permissions(TRUELAYER_CONNECTIONS_FILE)
+        _write_truelayer_connections(connections)
         logging.debug(f"Successfully updated TrueLayer connection: {connection_id}")
     except IOError as e:
         logging.error(f"Error updating TrueLayer connection {connection_id}: {e}")
@@ -157,9 +185,7 @@ def update_connection_last_sync(connection_ids: List[str]) -> None:
             updated_count += 1
 
     try:
-        with open(TRUELAYER_CONNECTIONS_FILE, "w") as f:
-            json.dump(connections, f, indent=4)
-        _set_secure_permissions(TRUELAYER_CONNECTIONS_FILE)
+        _write_truelayer_connections(connections)
         logging.debug(
             f"Successfully updated last_sync for {updated_count} connection(s)."
         )
@@ -185,9 +211,7 @@ def remove_truelayer_connection(connection_id: str) -> None:
         return
 
     try:
-        with open(TRUELAYER_CONNECTIONS_FILE, "w") as f:
-            json.dump(updated_connections, f, indent=4)
-        _set_secure_permissions(TRUELAYER_CONNECTIONS_FILE)
+        _write_truelayer_connections(updated_connections)
         logging.info(f"Successfully removed TrueLayer connection: {connection_id}")
     except IOError as e:
         logging.error(f"Error removing TrueLayer connection {connection_id}: {e}")
@@ -565,8 +589,6 @@ def convert_truelayer_transactions_to_dataframe(
     if not transactions:
         return None
 
-    df = pd.DataFrame(transactions)
-
     # TrueLayer transaction structure:
     # - timestamp: ISO 8601 timestamp
     # - description: Merchant name/description
@@ -574,15 +596,31 @@ def convert_truelayer_transactions_to_dataframe(
     # - transaction_type: DEBIT, CREDIT, etc.
     # - transaction_category: Category from bank
 
+    # Build only the fields used below, one column at a time; the rest of
+    # each transaction (meta, running_balance, ...) never becomes a column
+    fields = ["timestamp", "description", "amount", "transaction_type"]
+    df = pd.DataFrame(
+        {
+            field: [t.get(field) for t in transactions]
+            for field in fields
+            if any(field in t for t in transactions)
+        }
+    )
+
     required_fields = ["timestamp", "description", "amount"]
     if not all(field in df.columns for field in required_fields):
+        available = sorted({key for t in transactions for key in t})
         logging.error(
-            f"Missing required fields in TrueLayer transactions. Available: {df.columns.tolist()}"
+            f"Missing required fields in TrueLayer transactions. Available: {available}"
         )
         return None
 
-    # Convert timestamp to date
-    df["Date"] = pd.to_datetime(df["timestamp"], format="ISO8601").dt.date
+    # Convert timestamp to its calendar day. An ISO 8601 timestamp starts
+    # with the local wall-clock date, so parsing just that keeps the local day
+    # even when offsets differ between rows (e.g. either side of a DST
+    # change), and stays datetime64 instead of building a Python date object
+    # per row that append_transactions has to re-parse.
+    df["Date"] = pd.to_datetime(df["timestamp"].str[:10], format="%Y-%m-%d")
 
     # Use description as merchant name
     df["Merchant"] = df["description"]
@@ -27,3 +27,18 @@ def isolate_category_types(tmp_path):
     category_types_file = tmp_path / "category_types.json"
     with patch("expenses.data_handler.CATEGORY_TYPES_FILE", category_types_file):
         yield category_types_file
+
+
+@pytest.fixture(autouse=True)
+def isolate_gemini_cache(tmp_path):
+    """Prevent tests from reading or writing the real Gemini suggestion cache."""
+    gemini_cache_file = tmp_path / "gemini_cache.json"
+    with patch("expenses.gemini_utils.GEMINI_CACHE_FILE", gemini_cache_file):
+        yield gemini_cache_file
+
+
+@pytest.fixture(autouse=True)
+def reset_gemini_client():
+    """Give each test its own Gemini client, so mocks don't leak between tests."""
+    with patch("expenses.gemini_utils._client_cache", None):
+        yield
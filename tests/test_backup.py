@@ -317,6 +317,9 @@ class TestBackup(unittest.TestCase):
             assert stats["newest"] is not None
             assert stats["oldest"] is not None
 
+            # A listing the caller already has gives the same statistics
+            assert get_backup_stats(list_backups()) == stats
+
     def test_backup_creates_directory(self) -> None:
         """Test that backup creates auto_backups directory if it doesn't exist."""
         with (
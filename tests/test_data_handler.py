@@ -1,3 +1,4 @@
+import threading
 import unittest
 from unittest.mock import patch, MagicMock
 import tempfile
@@ -80,6 +81,63 @@ class TestDataHandler(unittest.TestCase):
             saved_df["Merchant"].tolist(), ["Existing Merchant", "New Merchant"]
         )
 
+    @patch("expenses.data_handler.save_categories")
+    @patch("expenses.data_handler.get_gemini_category_suggestions_for_merchants")
+    @patch("expenses.data_handler.load_categories")
+    @patch("expenses.data_handler.load_transactions_from_parquet")
+    @patch("expenses.data_handler.save_transactions_to_parquet")
+    def test_append_transactions_suggests_only_unknown_merchants(
+        self,
+        mock_save: MagicMock,
+        mock_load: MagicMock,
+        mock_load_categories: MagicMock,
+        mock_suggest: MagicMock,
+        mock_save_categories: MagicMock,
+    ) -> None:
+        # Only merchants missing from categories.json are sent to Gemini, once each
+        mock_load.return_value = pd.DataFrame(
+            columns=["Date", "Merchant", "Amount", "Deleted", "Type"]
+        )
+        mock_load_categories.return_value = {"Known": "Groceries"}
+        mock_suggest.return_value = {"New": "Shopping"}
+        new_df = pd.DataFrame(
+            {
+                "Date": pd.to_datetime(["2025-01-01", "2025-01-02", "2025-01-03"]),
+                "Merchant": ["New", "Known", "New"],
+                "Amount": [10.00, 20.00, 30.00],
+            }
+        )
+        append_transactions(new_df, suggest_categories=True)
+        mock_suggest.assert_called_once_with(["New"])
+        mock_save_categories.assert_called_once_with(
+            {"Known": "Groceries", "New": "Shopping"}
+        )
+
+    @patch("expenses.data_handler.get_gemini_category_suggestions_for_merchants")
+    @patch("expenses.data_handler.load_categories")
+    @patch("expenses.data_handler.load_transactions_from_parquet")
+    @patch("expenses.data_handler.save_transactions_to_parquet")
+    def test_append_transactions_skips_gemini_when_all_known(
+        self,
+        mock_save: MagicMock,
+        mock_load: MagicMock,
+        mock_load_categories: MagicMock,
+        mock_suggest: MagicMock,
+    ) -> None:
+        mock_load.return_value = pd.DataFrame(
+            columns=["Date", "Merchant", "Amount", "Deleted", "Type"]
+        )
+        mock_load_categories.return_value = {"Known": "Groceries"}
+        new_df = pd.DataFrame(
+            {
+                "Date": pd.to_datetime(["2025-01-01"]),
+                "Merchant": ["Known"],
+                "Amount": [10.00],
+            }
+        )
+        append_transactions(new_df, suggest_categories=True)
+        mock_suggest.assert_not_called()
+
     @patch("expenses.data_handler.load_transactions_from_parquet")
     @patch("expenses.data_handler.save_transactions_to_parquet")
     def test_delete_single_transaction(
@@ -180,6 +238,124 @@ class TestDataHandler(unittest.TestCase):
         self.assertEqual(len(saved_df), 1)
         self.assertEqual(saved_df["Deleted"].iloc[0], False)
 
+    @patch("expenses.data_handler.create_auto_backup")
+    @patch("expenses.data_handler.load_transactions_from_parquet")
+    @patch("expenses.data_handler.save_transactions_to_parquet")
+    def test_append_transactions_backs_up_only_when_rows_added(
+        self, mock_save: MagicMock, mock_load: MagicMock, mock_backup: MagicMock
+    ) -> None:
+        existing_df = pd.DataFrame(
+            {
+                "Date": pd.to_datetime(["2025-01-01"]),
+                "Merchant": ["Merchant A"],
+                "Amount": [10.00],
+                "Deleted": [False],
+                "Type": ["expense"],
+            }
+        )
+        # Re-importing the same transaction is a no-op and needs no backup
+        mock_load.return_value = existing_df.copy()
+        append_transactions(existing_df[["Date", "Merchant", "Amount"]].copy())
+        mock_backup.assert_not_called()
+
+        mock_load.return_value = existing_df.copy()
+        new_df = pd.DataFrame(
+            {
+                "Date": pd.to_datetime(["2025-01-02"]),
+                "Merchant": ["Merchant B"],
+                "Amount": [20.00],
+            }
+        )
+        append_transactions(new_df)
+        mock_backup.assert_called_once()
+
+    @patch("expenses.data_handler.create_auto_backup")
+    @patch("expenses.data_handler.save_categories")
+    @patch("expenses.data_handler.get_gemini_category_suggestions_for_merchants")
+    @patch("expenses.data_handler.load_categories")
+    @patch("expenses.data_handler.load_transactions_from_parquet")
+    @patch("expenses.data_handler.save_transactions_to_parquet")
+    def test_append_transactions_backs_up_before_saving_categories(
+        self,
+        mock_save: MagicMock,
+        mock_load: MagicMock,
+        mock_load_categories: MagicMock,
+        mock_suggest: MagicMock,
+        mock_save_categories: MagicMock,
+        mock_backup: MagicMock,
+    ) -> None:
+        # No new rows, but new suggestions still change categories.json, so
+        # a backup of the old file is taken before it is written
+        existing_df = pd.DataFrame(
+            {
+                "Date": pd.to_datetime(["2025-01-01"]),
+                "Merchant": ["Merchant A"],
+                "Amount": [10.00],
+                "Deleted": [False],
+                "Type": ["expense"],
+            }
+        )
+        mock_load.return_value = existing_df.copy()
+        mock_load_categories.return_value = {}
+        mock_suggest.return_value = {"Merchant A": "Shopping"}
+        calls = MagicMock()
+        calls.attach_mock(mock_backup, "backup")
+        calls.attach_mock(mock_save_categories, "save_categories")
+
+        append_transactions(
+            existing_df[["Date", "Merchant", "Amount"]].copy(),
+            suggest_categories=True,
+        )
+        self.assertEqual(
+            [name for name, _, _ in calls.mock_calls], ["backup", "save_categories"]
+        )
+
+    @patch("expenses.data_handler.create_auto_backup")
+    @patch("expenses.data_handler.load_transactions_from_parquet")
+    @patch("expenses.data_handler.save_transactions_to_parquet")
+    def test_delete_transactions_backs_up_only_when_rows_change(
+        self, mock_save: MagicMock, mock_load: MagicMock, mock_backup: MagicMock
+    ) -> None:
+        existing_df = pd.DataFrame(
+            {
+                "Date": pd.to_datetime(["2025-01-01", "2025-01-02"]),
+                "Merchant": ["Merchant A", "Merchant B"],
+                "Amount": [10.00, 20.00],
+                "Deleted": [True, False],
+            }
+        )
+        # Deleting an already-deleted row changes nothing
+        mock_load.return_value = existing_df.copy()
+        delete_transactions(existing_df.iloc[[0]][["Date", "Merchant", "Amount"]])
+        mock_backup.assert_not_called()
+
+        mock_load.return_value = existing_df.copy()
+        delete_transactions(existing_df.iloc[[1]][["Date", "Merchant", "Amount"]])
+        mock_backup.assert_called_once()
+
+    @patch("expenses.data_handler.create_auto_backup")
+    @patch("expenses.data_handler.load_transactions_from_parquet")
+    @patch("expenses.data_handler.save_transactions_to_parquet")
+    def test_update_transactions_backup_finishes_before_save(
+        self, mock_save: MagicMock, mock_load: MagicMock, mock_backup: MagicMock
+    ) -> None:
+        events = []
+        mock_backup.side_effect = lambda: events.append(
+            ("backup", threading.current_thread() is threading.main_thread())
+        )
+        mock_save.side_effect = lambda df: events.append(("save", True))
+        mock_load.return_value = pd.DataFrame(
+            {
+                "Date": pd.to_datetime(["2025-01-01"]),
+                "Merchant": ["Merchant A"],
+                "Amount": [10.00],
+                "Deleted": [False],
+            }
+        )
+        update_transactions([{"original_index": 0, "Amount": 12.5}])
+        # The backup runs off the main thread but completes before the write
+        self.assertEqual(events, [("backup", False), ("save", True)])
+
     @patch("expenses.data_handler.load_transactions_from_parquet")
     @patch("expenses.data_handler.save_transactions_to_parquet")
     def test_update_single_transaction(
@@ -1,12 +1,16 @@
 """Extended tests for data_handler to improve coverage."""
 
+import os
+import re
 import unittest
 import tempfile
 import json
 from pathlib import Path
 from unittest.mock import patch
 import pandas as pd
+import pyarrow.parquet as pq
 
+from expenses import data_handler
 from expenses.data_handler import (
     load_transactions_from_parquet,
     save_transactions_to_parquet,
@@ -15,7 +19,11 @@ from expenses.data_handler import (
     load_categories,
     save_categories,
     load_default_categories,
+    load_category_types,
+    save_category_types,
     clean_amount,
+    apply_merchant_alias,
+    apply_merchant_aliases_to_series,
 )
 
 
@@ -50,6 +58,50 @@ class TestDataHandlerExtended(unittest.IsolatedAsyncioTestCase):
             loaded = load_categories()
             assert loaded == test_categories
 
+    def test_load_categories_reuses_parse_until_file_changes(self) -> None:
+        """Cached categories are copied out and refreshed when the file changes."""
+        with patch("expenses.data_handler.CATEGORIES_FILE", self.categories_file):
+            self.categories_file.write_text(json.dumps({"Tesco": "Groceries"}))
+
+            first = load_categories()
+            first["Shell"] = "Fuel"
+            with patch("builtins.open", wraps=open) as mock_open:
+                assert load_categories() == {"Tesco": "Groceries"}
+            mock_open.assert_not_called()
+
+            self.categories_file.write_text(json.dumps({"Aldi": "Groceries"}))
+            assert load_categories() == {"Aldi": "Groceries"}
+
+    def test_load_category_types_reuses_parse_until_saved(self) -> None:
+        """Category types are parsed once, deep-copied out, and refreshed on save."""
+        types = {
+            "essential": {"categories": ["Rent"], "annual_budget": None},
+            "discretionary": {"categories": [], "annual_budget": 100.0},
+        }
+        save_category_types(types)
+
+        first = load_category_types()
+        first["essential"]["categories"].append("Groceries")
+        with patch("builtins.open", wraps=open) as mock_open:
+            assert load_category_types() == types
+        mock_open.assert_not_called()
+
+        types["essential"]["categories"] = ["Mortgage"]
+        save_category_types(types)
+        assert load_category_types()["essential"]["categories"] == ["Mortgage"]
+
+    def test_load_categories_reports_invalid_json(self) -> None:
+        """Corrupted JSON is treated as empty whichever parser is in use."""
+        with patch("expenses.data_handler.CATEGORIES_FILE", self.categories_file):
+            self.categories_file.write_text('{"Tesco": ')
+            with self.assertLogs(level="WARNING"):
+                assert load_categories() == {}
+            with (
+                patch("expenses.data_handler.orjson", None),
+                self.assertLogs(level="WARNING"),
+            ):
+                assert load_categories() == {}
+
     def test_load_default_categories(self) -> None:
         """Test loading default categories."""
         with patch(
@@ -133,6 +185,38 @@ class TestDataHandlerExtended(unittest.IsolatedAsyncioTestCase):
             result = load_transactions_from_parquet()
             assert len(result) == 3
 
+    def test_append_transactions_aligns_date_resolution(self) -> None:
+        """Dates at another resolution are aligned so pd.concat is not needed."""
+        with (
+            patch("expenses.data_handler.TRANSACTIONS_FILE", self.transactions_file),
+            patch("expenses.data_handler.CATEGORIES_FILE", self.categories_file),
+        ):
+            append_transactions(
+                pd.DataFrame(
+                    {
+                        "Date": pd.to_datetime(["2025-01-01"]),
+                        "Merchant": ["A"],
+                        "Amount": [10.0],
+                    }
+                )
+            )
+            new = pd.DataFrame(
+                {
+                    "Date": pd.to_datetime(["2025-01-02"]).astype("datetime64[us]"),
+                    "Merchant": ["B"],
+                    "Amount": [20.0],
+                }
+            )
+            with patch("expenses.data_handler.pd.concat") as mock_concat:
+                append_transactions(new)
+            mock_concat.assert_not_called()
+
+            result = load_transactions_from_parquet()
+            assert result["Date"].dtype == "datetime64[ns]"
+            assert result["Date"].tolist() == list(
+                pd.to_datetime(["2025-01-01", "2025-01-02"])
+            )
+
     def test_append_transactions_to_empty_file(self) -> None:
         """Test appending transactions when no file exists."""
         with (
@@ -203,6 +287,28 @@ class TestDataHandlerExtended(unittest.IsolatedAsyncioTestCase):
         cleaned = clean_amount(amounts)
         assert cleaned.tolist() == [1000.50, 2500.00, 3000.0]
 
+    def test_clean_amount_rounds_to_cents(self) -> None:
+        """Test clean_amount rounds parsed amounts to two decimals."""
+        amounts = pd.Series(["10.004", "(2.456)", "$3.333"])
+        cleaned = clean_amount(amounts)
+        assert cleaned.tolist() == [10.0, -2.46, 3.33]
+
+    def test_clean_amount_result_is_writable(self) -> None:
+        """The cleaned Series owns its data and can be edited in place."""
+        for amounts in (pd.Series(["$1.00", "-"]), pd.Series([1.0, float("nan")])):
+            cleaned = clean_amount(amounts)
+            cleaned.iloc[0] = 5.0
+            assert cleaned.tolist() == [5.0, 0.0]
+        assert amounts.isna().iloc[1]
+
+    def test_clean_amount_numeric_input(self) -> None:
+        """Numeric input is rounded directly, with missing values as 0."""
+        amounts = pd.Series([10.004, float("nan"), -2.456, 7], index=[3, 5, 7, 9])
+        cleaned = clean_amount(amounts)
+        assert cleaned.tolist() == [10.0, 0.0, -2.46, 7.0]
+        assert cleaned.index.tolist() == [3, 5, 7, 9]
+        assert cleaned.dtype == "float64"
+
     def test_save_transactions_creates_directory(self) -> None:
         """Test that save_transactions creates directory if needed."""
         nested_dir = Path(self.test_dir) / "nested" / "path"
@@ -269,6 +375,341 @@ class TestDataHandlerExtended(unittest.IsolatedAsyncioTestCase):
             assert "Category" in result.columns
             assert len(result) == 2
 
+    def test_save_transactions_writes_zstd_parquet(self) -> None:
+        """Transactions are written zstd-compressed and read back unchanged."""
+        with (
+            patch("expenses.data_handler.TRANSACTIONS_FILE", self.transactions_file),
+            patch("expenses.data_handler.CONFIG_DIR", Path(self.test_dir)),
+        ):
+            transactions = pd.DataFrame(
+                {
+                    "Date": pd.to_datetime(["2025-01-01", "2025-01-02"]),
+                    "Merchant": ["A", "A"],
+                    "Amount": [10.0, 20.0],
+                }
+            )
+            save_transactions_to_parquet(transactions)
+
+            metadata = pq.ParquetFile(self.transactions_file).metadata
+            assert metadata.row_group(0).column(0).compression == "ZSTD"
+            result = load_transactions_from_parquet()
+            pd.testing.assert_frame_equal(
+                result[transactions.columns], transactions, check_dtype=False
+            )
+
+    def test_save_transactions_syncs_before_replacing(self) -> None:
+        """The new file's data reaches disk before it replaces the old one."""
+        with (
+            patch("expenses.data_handler.TRANSACTIONS_FILE", self.transactions_file),
+            patch("expenses.data_handler.CONFIG_DIR", Path(self.test_dir)),
+            patch("expenses.data_handler.os.fsync") as mock_fsync,
+            patch("expenses.data_handler.os.replace", wraps=os.replace) as mock_replace,
+        ):
+            mock_fsync.side_effect = lambda fd: mock_replace.assert_not_called()
+            transactions = pd.DataFrame(
+                {
+                    "Date": pd.to_datetime(["2025-01-01"]),
+                    "Merchant": ["A"],
+                    "Amount": [10.0],
+                }
+            )
+            save_transactions_to_parquet(transactions)
+
+            mock_fsync.assert_called_once()
+            mock_replace.assert_called_once()
+            assert len(load_transactions_from_parquet()) == 1
+
+    @unittest.skipIf(os.name == "nt", "POSIX permissions only")
+    def test_saved_files_are_owner_only_without_chmod_after_rename(self) -> None:
+        """The temporary file is secured before the rename, not the final path."""
+        with (
+            patch("expenses.data_handler.TRANSACTIONS_FILE", self.transactions_file),
+            patch("expenses.data_handler.CATEGORIES_FILE", self.categories_file),
+            patch("expenses.data_handler.CONFIG_DIR", Path(self.test_dir)),
+            patch(
+                "expenses.data_handler._set_secure_permissions",
+                wraps=data_handler._set_secure_permissions,
+            ) as mock_secure,
+        ):
+            save_transactions_to_parquet(
+                pd.DataFrame(
+                    {
+                        "Date": pd.to_datetime(["2025-01-01"]),
+                        "Merchant": ["A"],
+                        "Amount": [10.0],
+                    }
+                )
+            )
+            save_categories({"A": "Shopping"})
+
+            for path in (self.transactions_file, self.categories_file):
+                assert path.stat().st_mode & 0o777 == 0o600
+            secured = [call.args[0] for call in mock_secure.call_args_list]
+            assert self.transactions_file not in secured
+            assert self.categories_file not in secured
+
+    def test_save_transactions_skips_unchanged_data(self) -> None:
+        """Saving identical data twice should not rewrite the parquet file."""
+        with (
+            patch("expenses.data_handler.TRANSACTIONS_FILE", self.transactions_file),
+            patch("expenses.data_handler.CONFIG_DIR", Path(self.test_dir)),
+        ):
+            transactions = pd.DataFrame(
+                {
+                    "Date": pd.to_datetime(["2025-01-01"]),
+                    "Merchant": ["A"],
+                    "Amount": [10.0],
+                }
+            )
+            save_transactions_to_parquet(transactions)
+            first_inode = self.transactions_file.stat().st_ino
+
+            save_transactions_to_parquet(transactions.copy())
+
+            # Atomic writes swap in a new inode, so an unchanged inode means no write
+            assert self.transactions_file.stat().st_ino == first_inode
+            assert not self.transactions_file.with_name(
+                "transactions.parquet.tmp"
+            ).exists()
+
+    def test_save_transactions_rewrites_externally_replaced_file(self) -> None:
+        """A file replaced behind our back (e.g. restore) must be rewritten."""
+        with (
+            patch("expenses.data_handler.TRANSACTIONS_FILE", self.transactions_file),
+            patch("expenses.data_handler.CONFIG_DIR", Path(self.test_dir)),
+        ):
+            transactions = pd.DataFrame(
+                {
+                    "Date": pd.to_datetime(["2025-01-01"]),
+                    "Merchant": ["A"],
+                    "Amount": [10.0],
+                }
+            )
+            save_transactions_to_parquet(transactions)
+
+            restored = transactions.assign(Merchant=["Restored"])
+            restored.to_parquet(self.transactions_file, index=False)
+
+            save_transactions_to_parquet(transactions)
+
+            result = load_transactions_from_parquet()
+            assert result["Merchant"].tolist() == ["A"]
+
+    def test_load_transactions_sees_external_rewrite(self) -> None:
+        """Cached transactions must not hide a file rewritten on disk."""
+        with patch("expenses.data_handler.TRANSACTIONS_FILE", self.transactions_file):
+            first = pd.DataFrame(
+                {
+                    "Date": pd.to_datetime(["2025-01-01"]),
+                    "Merchant": ["A"],
+                    "Amount": [10.0],
+                }
+            )
+            first.to_parquet(self.transactions_file, index=False)
+            assert load_transactions_from_parquet()["Merchant"].tolist() == ["A"]
+
+            second = pd.DataFrame(
+                {
+                    "Date": pd.to_datetime(["2025-01-01", "2025-01-02"]),
+                    "Merchant": ["A", "B"],
+                    "Amount": [10.0, 20.0],
+                }
+            )
+            second.to_parquet(self.transactions_file, index=False)
+            assert load_transactions_from_parquet()["Merchant"].tolist() == ["A", "B"]
+
+    def test_apply_merchant_aliases_to_series_matches_per_row(self) -> None:
+        """The series path agrees with apply_merchant_alias row by row."""
+        aliases = {
+            "AMAZON.*": "Amazon",
+            "^pos apple": "Apple",
+            "[invalid": "Broken",
+            "COFFEE|CAFE": "Coffee",
+            ".*": "Catch-all",
+        }
+        merchants = pd.Series(
+            ["AMAZON MKTPLACE", "POS APPLE.COM/BILL", "Corner Cafe", "Unknown", ""],
+            index=[10, 11, 12, 13, 14],
+            name="Merchant",
+        )
+        result = apply_merchant_aliases_to_series(merchants, aliases)
+        expected = [apply_merchant_alias(m, aliases) for m in merchants]
+        assert result.tolist() == expected
+        assert result.tolist() == ["Amazon", "Apple", "Coffee", "Catch-all", ""]
+        assert result.index.tolist() == [10, 11, 12, 13, 14]
+
+    def test_apply_merchant_aliases_to_series_repeated_and_missing(self) -> None:
+        """Repeated names map consistently and missing values pass through."""
+        aliases = {"TESCO": "Tesco"}
+        merchants = pd.Series(["TESCO 12", None, "TESCO 12", "Aldi", "TESCO 12"])
+        result = apply_merchant_aliases_to_series(merchants, aliases)
+        assert result.tolist() == ["Tesco", None, "Tesco", "Aldi", "Tesco"]
+
+    def test_apply_merchant_aliases_to_series_handles_groups(self) -> None:
+        """Patterns with their own groups/backreferences still match."""
+        aliases = {r"^(\w)\1": "Doubled", "SHOP": "Shop"}
+        merchants = pd.Series(["AAB STORE", "Corner Shop", "Other"])
+        with patch(
+            "expenses.data_handler._compile_merchant_aliases",
+            wraps=data_handler._compile_merchant_aliases,
+        ) as mock_compile:
+            result = apply_merchant_aliases_to_series(merchants, aliases)
+        assert result.tolist() == ["Doubled", "Shop", "Other"]
+        # The compiled aliases are looked up once, not once per name
+        mock_compile.assert_called_once()
+
+    def test_apply_merchant_alias_literal_prefilter_matches_regex(self) -> None:
+        """Substring shortcuts give the same answers as re.IGNORECASE."""
+        aliases = {"strasse": "Street", "\u212aiosk": "Kiosk", r"AMAZON\.\w+": "Amazon"}
+        assert apply_merchant_alias("STRASSE 1", aliases) == "Street"
+        assert apply_merchant_alias("Straße 1", aliases) == "Straße 1"
+        assert apply_merchant_alias("KIOSK 24", aliases) == "Kiosk"
+        assert apply_merchant_alias("amazon.de", aliases) == "Amazon"
+        assert apply_merchant_alias("amazon de", aliases) == "amazon de"
+
+    def test_required_literal_reads_braces_like_re(self) -> None:
+        """Only a valid {m,n} repeat is a quantifier; any other "{" is literal."""
+        assert data_handler._required_literal("SHOP{2}X") == "sho"
+        assert data_handler._required_literal("SHOP{X}") == "shop{x}"
+        assert data_handler._required_literal(r"CARD\d{4}.*REF") == "card"
+
+    def test_apply_merchant_alias_simplified_patterns_match_the_same(self) -> None:
+        """Redundant .* in user patterns doesn't change which names match."""
+        aliases = {"AMAZON.*": "Amazon", "POS.*.*APPLE": "Apple", r"DOTS\.*": "Dots"}
+        assert apply_merchant_alias("AMAZON MKTPLACE", aliases) == "Amazon"
+        assert apply_merchant_alias("Pay AMAZON", aliases) == "Amazon"
+        assert apply_merchant_alias("POS 123 APPLE", aliases) == "Apple"
+        assert apply_merchant_alias("APPLE POS", aliases) == "APPLE POS"
+        assert apply_merchant_alias("dots", aliases) == "Dots"
+
+    def test_apply_merchant_alias_strips_leading_wildcard(self) -> None:
+        """A leading .* is dropped, leaving plain text on the substring path."""
+        aliases = {".*NETFLIX.*": "Netflix", ".*(?:SHELL|BP) ": "Fuel"}
+        [(literal, regex, _), _] = data_handler._compile_merchant_aliases(aliases)
+        assert (literal, regex) == ("netflix", None)
+        for name in ["netflix.com", "PAY NETFLIX", "SHELL 12", "a\nBP 1", "NET FLIX"]:
+            expected = next(
+                (a for p, a in aliases.items() if re.search(p, name, re.IGNORECASE)),
+                name,
+            )
+            assert apply_merchant_alias(name, aliases) == expected
+
+    def test_apply_merchant_alias_compiles_once(self) -> None:
+        """Invalid patterns are reported once, not on every merchant lookup."""
+        aliases = {"(unclosed": "Broken", "tesco stores": "Tesco"}
+        with self.assertLogs(level="WARNING") as logs:
+            assert apply_merchant_alias("TESCO STORES 1234", aliases) == "Tesco"
+            assert apply_merchant_alias("Other", dict(aliases)) == "Other"
+        assert len(logs.records) == 1
+
+    def test_load_transactions_reuses_cached_frame(self) -> None:
+        """An unchanged file is decoded once; callers get independent copies."""
+        with patch("expenses.data_handler.TRANSACTIONS_FILE", self.transactions_file):
+            pd.DataFrame(
+                {
+                    "Date": pd.to_datetime(["2025-01-01", "2025-01-02"]),
+                    "Merchant": ["A", "B"],
+                    "Amount": [10.0, 20.0],
+                    "Deleted": [False, True],
+                }
+            ).to_parquet(self.transactions_file, index=False)
+
+            first = load_transactions_from_parquet(include_deleted=True)
+            first.loc[0, "Merchant"] = "Changed"
+
+            with patch("expenses.data_handler._read_transactions_table") as mock_read:
+                second = load_transactions_from_parquet(include_deleted=True)
+                visible = load_transactions_from_parquet()
+            mock_read.assert_not_called()
+            assert second["Merchant"].tolist() == ["A", "B"]
+            assert visible["Merchant"].tolist() == ["A"]
+
+    def test_save_transactions_seeds_load_cache(self) -> None:
+        """A load right after a save reuses the written data, not the file."""
+        with patch("expenses.data_handler.TRANSACTIONS_FILE", self.transactions_file):
+            df = pd.DataFrame(
+                {
+                    "Date": pd.to_datetime(["2025-01-01", "2025-01-02"]),
+                    "Merchant": ["A", None],
+                    "Amount": [10.0, 20.0],
+                    "Source": ["Manual", "Manual"],
+                    "Deleted": [False, True],
+                    "Type": ["expense", "income"],
+                    "Tags": ["", "trip"],
+                },
+                index=[3, 7],
+            )
+            save_transactions_to_parquet(df)
+            df.loc[3, "Amount"] = 99.0
+
+            with patch("expenses.data_handler._read_transactions_table") as mock_read:
+                cached = load_transactions_from_parquet(include_deleted=True)
+            mock_read.assert_not_called()
+
+            data_handler._transactions_cache = None
+            from_file = load_transactions_from_parquet(include_deleted=True)
+            pd.testing.assert_frame_equal(cached, from_file)
+            assert cached["Amount"].tolist() == [10.0, 20.0]
+
+    def test_load_transactions_projects_columns(self) -> None:
+        """Only the requested columns come back, still without deleted rows."""
+        with patch("expenses.data_handler.TRANSACTIONS_FILE", self.transactions_file):
+            pd.DataFrame(
+                {
+                    "Date": pd.to_datetime(["2025-01-01", "2025-01-02"]),
+                    "Merchant": ["A", "B"],
+                    "Amount": [10.0, 20.0],
+                    "Deleted": [True, False],
+                }
+            ).to_parquet(self.transactions_file, index=False)
+
+            visible = load_transactions_from_parquet(columns=["Merchant", "Missing"])
+            assert visible.columns.tolist() == ["Merchant"]
+            assert visible["Merchant"].tolist() == ["B"]
+            assert visible.index.tolist() == [1]
+
+            everything = load_transactions_from_parquet(
+                include_deleted=True, columns=["Amount"]
+            )
+            assert everything["Amount"].tolist() == [10.0, 20.0]
+
+    def test_unrounded_stored_amounts_still_deduplicate(self) -> None:
+        """Amounts stored unrounded by older versions still match re-imports."""
+        with patch("expenses.data_handler.TRANSACTIONS_FILE", self.transactions_file):
+            pd.DataFrame(
+                {
+                    "Date": pd.to_datetime(["2025-01-01"]),
+                    "Merchant": ["A"],
+                    "Amount": [12.3456],
+                    "Deleted": [False],
+                }
+            ).to_parquet(self.transactions_file, index=False)
+
+            append_transactions(
+                pd.DataFrame(
+                    {"Date": ["2025-01-01"], "Merchant": ["A"], "Amount": [12.35]}
+                ),
+                suggest_categories=False,
+            )
+            assert load_transactions_from_parquet()["Amount"].tolist() == [12.35]
+
+    def test_update_transactions_rounds_amounts(self) -> None:
+        """Edited amounts are stored rounded, like every other write path."""
+        with patch("expenses.data_handler.TRANSACTIONS_FILE", self.transactions_file):
+            pd.DataFrame(
+                {
+                    "Date": pd.to_datetime(["2025-01-01"]),
+                    "Merchant": ["A"],
+                    "Amount": [10.0],
+                    "Deleted": [False],
+                }
+            ).to_parquet(self.transactions_file, index=False)
+
+            data_handler.update_transactions(
+                [{"original_index": 0, "Amount": "12.3456"}]
+            )
+            assert load_transactions_from_parquet()["Amount"].tolist() == [12.35]
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,17 @@
 import unittest
 from unittest.mock import patch, MagicMock, mock_open
 import json
-from expenses.gemini_utils import get_gemini_category_suggestions_for_merchants
+import os
+import subprocess
+import sys
+from expenses import gemini_utils
+from expenses.gemini_utils import (
+    _build_gemini_prompt,
+    _load_suggestion_cache,
+    _parse_gemini_response,
+    _save_suggestion_cache,
+    get_gemini_category_suggestions_for_merchants,
+)
 
 
 class TestGeminiUtils(unittest.TestCase):
@@ -13,7 +23,7 @@ class TestGeminiUtils(unittest.TestCase):
         self.assertEqual(result, {})
 
     @patch.dict("os.environ", {"GEMINI_API_KEY": "test-key"})
-    @patch("expenses.gemini_utils.genai.Client")
+    @patch("google.genai.Client")
     @patch("expenses.gemini_utils.CATEGORIES_FILE")
     def test_successful_categorization_no_existing_categories(
         self, mock_categories_file: MagicMock, mock_client_class: MagicMock
@@ -41,7 +51,7 @@ class TestGeminiUtils(unittest.TestCase):
         mock_client.models.generate_content.assert_called_once()
 
     @patch.dict("os.environ", {"GEMINI_API_KEY": "test-key"})
-    @patch("expenses.gemini_utils.genai.Client")
+    @patch("google.genai.Client")
     @patch("expenses.gemini_utils.CATEGORIES_FILE")
     def test_successful_categorization_with_existing_categories(
         self, mock_categories_file: MagicMock, mock_client_class: MagicMock
@@ -67,7 +77,48 @@ class TestGeminiUtils(unittest.TestCase):
             self.assertIn("Groceries", call_args.kwargs["contents"])
 
     @patch.dict("os.environ", {"GEMINI_API_KEY": "test-key"})
-    @patch("expenses.gemini_utils.genai.Client")
+    @patch("google.genai.Client")
+    @patch("expenses.gemini_utils.CATEGORIES_FILE")
+    def test_requests_json_mode(
+        self, mock_categories_file: MagicMock, mock_client_class: MagicMock
+    ) -> None:
+        """Test that the request asks for a bare JSON response."""
+        mock_categories_file.exists.return_value = False
+
+        mock_client = MagicMock()
+        mock_response = MagicMock()
+        mock_response.text = '{"Tesco": "Groceries"}'
+        mock_client.models.generate_content.return_value = mock_response
+        mock_client_class.return_value = mock_client
+
+        result = get_gemini_category_suggestions_for_merchants(["Tesco"])
+
+        self.assertEqual(result, {"Tesco": "Groceries"})
+        config = mock_client.models.generate_content.call_args.kwargs["config"]
+        self.assertEqual(config.response_mime_type, "application/json")
+
+    @patch.dict("os.environ", {"GEMINI_API_KEY": "test-key"})
+    @patch("google.genai.Client")
+    @patch("expenses.gemini_utils.CATEGORIES_FILE")
+    def test_client_retries_transient_errors(
+        self, mock_categories_file: MagicMock, mock_client_class: MagicMock
+    ) -> None:
+        """Test that the client is built with retry options."""
+        mock_categories_file.exists.return_value = False
+
+        mock_client = MagicMock()
+        mock_response = MagicMock()
+        mock_response.text = '{"Tesco": "Groceries"}'
+        mock_client.models.generate_content.return_value = mock_response
+        mock_client_class.return_value = mock_client
+
+        get_gemini_category_suggestions_for_merchants(["Tesco"])
+
+        http_options = mock_client_class.call_args.kwargs["http_options"]
+        self.assertEqual(http_options.retry_options.attempts, 4)
+
+    @patch.dict("os.environ", {"GEMINI_API_KEY": "test-key"})
+    @patch("google.genai.Client")
     @patch("expenses.gemini_utils.CATEGORIES_FILE")
     def test_api_error_handling(
         self, mock_categories_file: MagicMock, mock_client_class: MagicMock
@@ -85,7 +136,7 @@ class TestGeminiUtils(unittest.TestCase):
         self.assertEqual(result, {})
 
     @patch.dict("os.environ", {"GEMINI_API_KEY": "test-key"})
-    @patch("expenses.gemini_utils.genai.Client")
+    @patch("google.genai.Client")
     @patch("expenses.gemini_utils.CATEGORIES_FILE")
     def test_invalid_json_response(
         self, mock_categories_file: MagicMock, mock_client_class: MagicMock
@@ -103,8 +154,14 @@ class TestGeminiUtils(unittest.TestCase):
 
         self.assertEqual(result, {})
 
+        # Valid JSON that isn't an object is dropped the same way
+        for text in ('["Shopping"]', '"Shopping"', "null"):
+            mock_response.text = text
+            result = get_gemini_category_suggestions_for_merchants(["Target"])
+            self.assertEqual(result, {})
+
     @patch.dict("os.environ", {"GEMINI_API_KEY": "test-key"})
-    @patch("expenses.gemini_utils.genai.Client")
+    @patch("google.genai.Client")
     @patch("expenses.gemini_utils.CATEGORIES_FILE")
     def test_categories_file_with_list_format(
         self, mock_categories_file: MagicMock, mock_client_class: MagicMock
@@ -125,7 +182,7 @@ class TestGeminiUtils(unittest.TestCase):
             self.assertEqual(result, {"Netflix": "Subscriptions"})
 
     @patch.dict("os.environ", {"GEMINI_API_KEY": "test-key"})
-    @patch("expenses.gemini_utils.genai.Client")
+    @patch("google.genai.Client")
     @patch("expenses.gemini_utils.CATEGORIES_FILE")
     def test_empty_merchant_list(
         self, mock_categories_file: MagicMock, mock_client_class: MagicMock
@@ -141,8 +198,259 @@ class TestGeminiUtils(unittest.TestCase):
 
         result = get_gemini_category_suggestions_for_merchants([])
 
-        # Should still call API (though it's not optimal)
+        # Nothing to categorize, so no request is made
         self.assertEqual(result, {})
+        mock_client.models.generate_content.assert_not_called()
+
+    @patch.dict("os.environ", {"GEMINI_API_KEY": "test-key"})
+    @patch("google.genai.Client")
+    @patch("expenses.gemini_utils.CATEGORIES_FILE")
+    def test_large_merchant_list_is_batched(
+        self, mock_categories_file: MagicMock, mock_client_class: MagicMock
+    ) -> None:
+        """Test that long lists are split into batches and the results merged."""
+        mock_categories_file.exists.return_value = False
+
+        def generate_content(model, contents, config):
+            names = [
+                line.strip()[2:]
+                for line in contents.splitlines()
+                if line.strip().startswith("- Shop ")
+            ]
+            if "Shop 60" in names:
+                raise Exception("API Error")
+            response = MagicMock()
+            response.text = json.dumps({name: "Shopping" for name in names})
+            return response
+
+        mock_client = MagicMock()
+        mock_client.models.generate_content.side_effect = generate_content
+        mock_client_class.return_value = mock_client
+
+        merchants = [f"Shop {i}" for i in range(120)] + ["Shop 0"]
+        result = get_gemini_category_suggestions_for_merchants(merchants)
+
+        self.assertEqual(mock_client.models.generate_content.call_count, 3)
+        # The batch holding Shop 50-99 failed; the other two still count
+        self.assertEqual(
+            set(result), {f"Shop {i}" for i in [*range(50), *range(100, 120)]}
+        )
+
+    @patch.dict("os.environ", {"GEMINI_API_KEY": "test-key"})
+    @patch("google.genai.Client")
+    @patch("expenses.gemini_utils.CATEGORIES_FILE")
+    def test_suggestions_are_cached_between_calls(
+        self, mock_categories_file: MagicMock, mock_client_class: MagicMock
+    ) -> None:
+        """Test that merchants seen before are answered from the on-disk cache."""
+        mock_categories_file.exists.return_value = False
+
+        mock_client = MagicMock()
+        mock_response = MagicMock()
+        mock_response.text = '{"Tesco": "Groceries"}'
+        mock_client.models.generate_content.return_value = mock_response
+        mock_client_class.return_value = mock_client
+
+        self.assertEqual(
+            get_gemini_category_suggestions_for_merchants(["Tesco"]),
+            {"Tesco": "Groceries"},
+        )
+        mock_response.text = '{"Aldi": "Groceries"}'
+        result = get_gemini_category_suggestions_for_merchants([" TESCO", "Aldi"])
+
+        self.assertEqual(result, {" TESCO": "Groceries", "Aldi": "Groceries"})
+        self.assertEqual(mock_client.models.generate_content.call_count, 2)
+        self.assertNotIn(
+            "TESCO", mock_client.models.generate_content.call_args.kwargs["contents"]
+        )
+
+        # Income suggestions are cached separately from expense ones
+        get_gemini_category_suggestions_for_merchants(["Tesco"], "income")
+        self.assertEqual(mock_client.models.generate_content.call_count, 3)
+
+        # All three requests went through the same client
+        self.assertEqual(mock_client_class.call_count, 1)
+
+    @patch("google.genai.Client")
+    @patch("expenses.gemini_utils.CATEGORIES_FILE")
+    def test_client_is_rebuilt_for_new_api_key(
+        self, mock_categories_file: MagicMock, mock_client_class: MagicMock
+    ) -> None:
+        """Test that changing GEMINI_API_KEY gives a client with the new key."""
+        mock_categories_file.exists.return_value = False
+        mock_client_class.return_value.models.generate_content.return_value.text = "{}"
+
+        for key in ["first-key", "first-key", "second-key"]:
+            with patch.dict("os.environ", {"GEMINI_API_KEY": key}):
+                get_gemini_category_suggestions_for_merchants(["Tesco"])
+
+        self.assertEqual(mock_client_class.call_count, 2)
+        self.assertEqual(mock_client_class.call_args.kwargs["api_key"], "second-key")
+
+    def test_google_genai_is_imported_only_for_requests(self) -> None:
+        """Test that importing the module (or having no API key) skips google.genai."""
+        code = (
+            "import os, sys\n"
+            "os.environ.pop('GEMINI_API_KEY', None)\n"
+            "from expenses import gemini_utils\n"
+            "gemini_utils.get_gemini_category_suggestions_for_merchants(['Tesco'])\n"
+            "assert 'google.genai' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_build_prompt_from_template(self) -> None:
+        """Test that the prompt keeps its example JSON and literal names."""
+        prompt = _build_gemini_prompt(["Shop {1}", "Bar"], "Use {these}.", "income")
+        self.assertIn("categorizes income sources", prompt)
+        self.assertIn('"Dividend Payment": "Dividends"\n    }', prompt)
+        self.assertIn("category. Use {these}.", prompt)
+        self.assertIn("- Shop {1}\n- Bar", prompt)
+
+    @patch.dict("os.environ", {"GEMINI_API_KEY": "test-key"})
+    @patch("expenses.gemini_utils.GEMINI_CACHE_TTL", "60")
+    @patch("expenses.gemini_utils.time.time")
+    @patch("google.genai.Client")
+    @patch("expenses.gemini_utils.CATEGORIES_FILE")
+    def test_cached_suggestions_expire_after_ttl(
+        self,
+        mock_categories_file: MagicMock,
+        mock_client_class: MagicMock,
+        mock_time: MagicMock,
+    ) -> None:
+        """Test that suggestions older than GEMINI_CACHE_TTL are requested again."""
+        mock_categories_file.exists.return_value = False
+
+        mock_client = MagicMock()
+        mock_response = MagicMock()
+        mock_response.text = '{"Tesco": "Groceries"}'
+        mock_client.models.generate_content.return_value = mock_response
+        mock_client_class.return_value = mock_client
+
+        for now in (1000.0, 1050.0, 1070.0):
+            mock_time.return_value = now
+            get_gemini_category_suggestions_for_merchants(["Tesco"])
+
+        # Reused 50s after the request, but fetched again after 70s
+        self.assertEqual(mock_client.models.generate_content.call_count, 2)
+
+    def test_parallel_requests_setting(self) -> None:
+        """Test that GEMINI_PARALLEL overrides the concurrency, ignoring bad values."""
+        cases = {None: 4, "2": 2, "0": 1, "many": 4}
+        for value, expected in cases.items():
+            with patch("expenses.gemini_utils.GEMINI_PARALLEL", value):
+                self.assertEqual(gemini_utils._max_concurrent_requests(), expected)
+
+    def test_suggestion_cache_keeps_most_recent_entries(self) -> None:
+        """Test that the cache drops its least recently used entries when full."""
+        cache = {f"key{i}": {"category": "X", "timestamp": i} for i in range(5)}
+        with patch("expenses.gemini_utils._SUGGESTION_CACHE_MAX_ENTRIES", 3):
+            _save_suggestion_cache(cache)
+        self.assertEqual(set(_load_suggestion_cache()), {"key2", "key3", "key4"})
+
+    def test_suggestion_cache_size_setting(self) -> None:
+        """Test that GEMINI_CACHE_MAX_ENTRIES overrides the size, ignoring bad values."""
+        cases = {None: 5000, "100": 100, "0": 1, "lots": 5000}
+        for value, expected in cases.items():
+            with patch("expenses.gemini_utils.GEMINI_CACHE_MAX_ENTRIES", value):
+                self.assertEqual(gemini_utils._suggestion_cache_max_entries(), expected)
+
+    @patch.dict("os.environ", {"GEMINI_API_KEY": "test-key"})
+    @patch("google.genai.Client")
+    @patch("expenses.gemini_utils.CATEGORIES_FILE")
+    def test_suggestion_cache_is_written_privately(
+        self, mock_categories_file: MagicMock, mock_client_class: MagicMock
+    ) -> None:
+        """Test that the cache file is owner-only and no temp file is left."""
+        mock_categories_file.exists.return_value = False
+        mock_client_class.return_value.models.generate_content.return_value.text = (
+            '{"Tesco": "Groceries"}'
+        )
+
+        get_gemini_category_suggestions_for_merchants(["Tesco"])
+
+        cache_file = gemini_utils.GEMINI_CACHE_FILE
+        self.assertEqual(os.stat(cache_file).st_mode & 0o777, 0o600)
+        self.assertFalse(cache_file.with_name(cache_file.name + ".tmp").exists())
+
+    @patch.dict("os.environ", {"GEMINI_API_KEY": "test-key"})
+    @patch("expenses.gemini_utils._SUGGESTION_CACHE_MAX_ENTRIES", 2)
+    @patch("expenses.gemini_utils.time.time")
+    @patch("google.genai.Client")
+    @patch("expenses.gemini_utils.CATEGORIES_FILE")
+    def test_cache_hits_keep_suggestions_from_eviction(
+        self,
+        mock_categories_file: MagicMock,
+        mock_client_class: MagicMock,
+        mock_time: MagicMock,
+    ) -> None:
+        """Test that a reused suggestion outlives an older-used one when full."""
+        mock_categories_file.exists.return_value = False
+        mock_client = mock_client_class.return_value
+        day = 24 * 60 * 60
+
+        def lookup(name: str, now: float) -> None:
+            mock_time.return_value = now
+            mock_client.models.generate_content.return_value.text = json.dumps(
+                {name: "Groceries"}
+            )
+            get_gemini_category_suggestions_for_merchants([name])
+
+        lookup("Tesco", 0)
+        lookup("Aldi", 1)
+        # Reusing Tesco a couple of days later refreshes its last use on disk,
+        # but a second reuse the same day doesn't rewrite the file
+        lookup("Tesco", 2 * day)
+        with patch("expenses.gemini_utils._save_suggestion_cache") as mock_save:
+            lookup("Tesco", 2 * day + 60)
+        mock_save.assert_not_called()
+        self.assertEqual(mock_client.models.generate_content.call_count, 2)
+
+        # Adding a third entry evicts Aldi, fetched later but used less recently
+        lookup("Lidl", 3 * day)
+        cached = _load_suggestion_cache()
+        key = gemini_utils._suggestion_cache_key
+        self.assertEqual(set(cached), {key("Tesco", "expense"), key("Lidl", "expense")})
+
+    @patch.dict("os.environ", {"GEMINI_API_KEY": "test-key"})
+    @patch("google.genai.Client")
+    @patch("expenses.gemini_utils.CATEGORIES_FILE")
+    def test_cache_entry_without_category_is_a_miss(
+        self, mock_categories_file: MagicMock, mock_client_class: MagicMock
+    ) -> None:
+        """Test that a malformed cache entry is requested again, not a crash."""
+        mock_categories_file.exists.return_value = False
+        mock_client_class.return_value.models.generate_content.return_value.text = (
+            '{"Tesco": "Groceries"}'
+        )
+        key = gemini_utils._suggestion_cache_key("Tesco", "expense")
+        _save_suggestion_cache({key: {"model": gemini_utils._GEMINI_MODEL}})
+
+        result = get_gemini_category_suggestions_for_merchants(["Tesco"])
+
+        self.assertEqual(result, {"Tesco": "Groceries"})
+        self.assertEqual(_load_suggestion_cache()[key]["category"], "Groceries")
+
+    def test_parse_response_with_and_without_orjson(self) -> None:
+        """Test that bare and fenced replies parse with either JSON parser."""
+        for loads in (gemini_utils._json_loads, json.loads):
+            with patch("expenses.gemini_utils._json_loads", loads):
+                self.assertEqual(
+                    _parse_gemini_response('{"Café": "Coffee"}'), {"Café": "Coffee"}
+                )
+                self.assertEqual(
+                    _parse_gemini_response('```json\n{"Shell": "Fuel"}\n```'),
+                    {"Shell": "Fuel"},
+                )
+
+    def test_parse_response_fence_variants(self) -> None:
+        """Test fenced replies with surrounding prose or a missing closing fence."""
+        replies = [
+            'Here you go:\n```json\n{"Shell": "Fuel"}\n```\nAnything else?',
+            '```\n{"Shell": "Fuel"}\n```',
+            '```json\n{"Shell": "Fuel"}',
+        ]
+        for reply in replies:
+            self.assertEqual(_parse_gemini_response(reply), {"Shell": "Fuel"})
 
 
 if __name__ == "__main__":
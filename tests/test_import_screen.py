@@ -110,6 +110,21 @@ class TestImportScreen(unittest.IsolatedAsyncioTestCase):
             date_select = pilot.app.screen.query_one("#date_select", Select)
             assert len(date_select._options) > 0
 
+    async def test_preview_keeps_dates_as_written(self) -> None:
+        """Test that ISO date columns are previewed as text, not as Timestamps."""
+        app = App()
+        async with app.run_test() as pilot:
+            screen = ImportScreen()
+            await pilot.app.push_screen(screen)
+
+            screen.file_path = str(self.test_csv)
+            screen.load_and_preview_csv()
+            await pilot.pause()
+
+            assert screen.df["Date"].tolist()[0] == "2025-01-01"
+            table = pilot.app.screen.query_one("#file_preview", DataTable)
+            assert table.get_row_at(0)[0] == "2025-01-01"
+
     async def test_browse_button_exists(self) -> None:
         """Test that browse button exists and triggers file browser screen."""
         app = App()
@@ -314,6 +314,21 @@ class TestConcurrency(unittest.TestCase):
         assert final_code is not None
         assert final_code.startswith("code_")
 
+    def test_wait_for_code_wakes_when_code_arrives(self):
+        """Test that a waiting thread is woken by set_auth_code."""
+        assert self.store.wait_for_code(timeout=0.01) is False
+
+        timer = threading.Timer(0.05, self.store.set_auth_code, args=("late_code",))
+        timer.start()
+        start = time.monotonic()
+        assert self.store.wait_for_code(timeout=5) is True
+        assert time.monotonic() - start < 5
+        timer.join()
+
+        # Retrieving the code resets the wait
+        assert self.store.get_auth_code() == "late_code"
+        assert self.store.wait_for_code(timeout=0.01) is False
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -9,6 +9,7 @@ from expenses.pdf_export import (
     export_transactions_pdf,
     format_currency,
     create_base_pdf,
+    _top_categories,
 )
 
 
@@ -217,3 +218,39 @@ def test_export_transactions_pdf_no_type_column(sample_categories):
             output_path=output_path,
         )
         assert os.path.exists(output_path)
+
+
+def test_export_leaves_caller_frame_untouched(sample_categories):
+    """The exporters add columns to their own frame, not the caller's."""
+    df = pd.DataFrame(
+        {
+            "Date": ["2024-01-05", "2024-01-10"],
+            "Merchant": ["Whole Foods", "Shell Gas"],
+            "Amount": [85.50, 45.00],
+        }
+    )
+    original = df.copy()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        export_transactions_pdf(
+            transactions=df,
+            categories=sample_categories,
+            output_path=os.path.join(tmpdir, "transactions.pdf"),
+        )
+        export_summary_pdf(
+            transactions=df,
+            categories=sample_categories,
+            output_path=os.path.join(tmpdir, "summary.pdf"),
+        )
+    pd.testing.assert_frame_equal(df, original)
+
+
+def test_top_categories_matches_mode():
+    """Most frequent category per merchant; ties sort first, none gives Other."""
+    df = pd.DataFrame(
+        {
+            "Merchant": ["A", "A", "A", "B", "B", "C"],
+            "Category": ["Fuel", "Groceries", "Groceries", "Travel", "Fuel", None],
+        }
+    )
+    result = _top_categories(df, "Merchant", pd.Series(["C", "B", "A"]))
+    assert result.tolist() == ["Other", "Fuel", "Groceries"]
@@ -7,6 +7,7 @@ from unittest.mock import patch
 from datetime import datetime
 import pandas as pd
 
+from expenses import data_handler
 from expenses.data_handler import (
     load_transactions_from_parquet,
     save_transactions_to_parquet,
@@ -337,6 +338,37 @@ class TestSoftDelete(unittest.TestCase):
             assert len(active) == 1
             assert active.iloc[0]["Merchant"] == "Store A"
 
+    def test_delete_with_repeated_keys_keeps_row_count(self) -> None:
+        """Repeating a key in the delete frame must not duplicate stored rows."""
+        with (
+            patch("expenses.data_handler.TRANSACTIONS_FILE", self.transactions_file),
+            patch("expenses.data_handler.CONFIG_DIR", Path(self.test_dir)),
+            patch("expenses.backup.TRANSACTIONS_FILE", self.transactions_file),
+            patch("expenses.backup.AUTO_BACKUP_DIR", Path(self.test_dir) / "backups"),
+        ):
+
+            df = pd.DataFrame(
+                {
+                    "Date": [datetime(2025, 1, 1), datetime(2025, 1, 2)],
+                    "Merchant": ["Store A", "Store B"],
+                    "Amount": [10.00, 20.00],
+                }
+            )
+            append_transactions(df)
+
+            to_delete = pd.DataFrame(
+                {
+                    "Date": [datetime(2025, 1, 1), datetime(2025, 1, 1)],
+                    "Merchant": ["Store A", "Store A"],
+                    "Amount": [10.00, 10.00],
+                }
+            )
+            delete_transactions(to_delete)
+
+            all_trans = load_transactions_from_parquet(include_deleted=True)
+            assert len(all_trans) == 2
+            assert all_trans["Deleted"].tolist() == [True, False]
+
     def test_delete_already_deleted_transaction(self) -> None:
         """Test soft-deleting an already deleted transaction (idempotent)."""
         with (
@@ -465,6 +497,87 @@ class TestSoftDelete(unittest.TestCase):
                 len(active) == 0
             ), "Re-imported deleted transaction should be filtered"
 
+    def test_reimport_of_deleted_aliased_merchant_is_filtered(self) -> None:
+        """Aliased names match deleted rows, with each side aliased only once."""
+        with (
+            patch("expenses.data_handler.TRANSACTIONS_FILE", self.transactions_file),
+            patch("expenses.data_handler.CONFIG_DIR", Path(self.test_dir)),
+            patch("expenses.data_handler.create_auto_backup"),
+            patch(
+                "expenses.data_handler.load_merchant_aliases",
+                return_value={"^STORE A": "Store A"},
+            ),
+        ):
+            save_transactions_to_parquet(
+                pd.DataFrame(
+                    {
+                        "Date": [datetime(2025, 1, 1), datetime(2025, 1, 2)],
+                        "Merchant": ["STORE A #1", "Store B"],
+                        "Amount": [10.00, 20.00],
+                        "Deleted": [True, False],
+                    }
+                )
+            )
+            df = pd.DataFrame(
+                {
+                    "Date": [datetime(2025, 1, 1), datetime(2025, 1, 3)],
+                    "Merchant": ["STORE A #2", "Store C"],
+                    "Amount": [10.00, 30.00],
+                }
+            )
+            with patch(
+                "expenses.data_handler.apply_merchant_aliases_to_series",
+                wraps=data_handler.apply_merchant_aliases_to_series,
+            ) as mock_alias:
+                append_transactions(df)
+            assert mock_alias.call_count == 2
+
+            all_trans = load_transactions_from_parquet(include_deleted=True)
+            assert all_trans["Merchant"].tolist() == [
+                "STORE A #1",
+                "Store B",
+                "Store C",
+            ]
+
+    def test_reimport_matches_deleted_rows_by_day(self) -> None:
+        """A re-import with a time of day still matches the deleted row's date."""
+        with (
+            patch("expenses.data_handler.TRANSACTIONS_FILE", self.transactions_file),
+            patch("expenses.data_handler.CONFIG_DIR", Path(self.test_dir)),
+            patch("expenses.data_handler.create_auto_backup"),
+        ):
+            save_transactions_to_parquet(
+                pd.DataFrame(
+                    {
+                        "Date": [datetime(2025, 1, 1)],
+                        "Merchant": ["Store A"],
+                        "Amount": [10.00],
+                        "Deleted": [True],
+                    }
+                )
+            )
+            df = pd.DataFrame(
+                {
+                    "Date": [
+                        datetime(2025, 1, 1, 10, 30),
+                        datetime(2025, 1, 2),
+                        datetime(2025, 1, 1),
+                    ],
+                    "Merchant": ["Store A", "Store A", "Store A"],
+                    "Amount": [10.00, 10.00, 11.00],
+                },
+                index=[5, 7, 9],
+            )
+            append_transactions(df)
+
+            all_trans = load_transactions_from_parquet(include_deleted=True)
+            assert all_trans["Date"].tolist() == [
+                pd.Timestamp(2025, 1, 1),
+                pd.Timestamp(2025, 1, 2),
+                pd.Timestamp(2025, 1, 1),
+            ]
+            assert all_trans["Amount"].tolist() == [10.00, 10.00, 11.00]
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -145,6 +145,12 @@ def test_initialize_truelayer_session_success(mock_credentials):
     assert session.headers["Content-Type"] == "application/json"
 
 
+def test_initialize_truelayer_session_is_reused(mock_credentials):
+    """Test that every call shares one session and its connection pool."""
+    with patch("expenses.truelayer_handler._session", None):
+        assert _initialize_truelayer_session() is _initialize_truelayer_session()
+
+
 def test_initialize_truelayer_session_no_credentials():
     """Test session initialization fails without credentials."""
     with patch("expenses.truelayer_handler.TRUELAYER_CLIENT_ID", None):
@@ -203,6 +209,20 @@ def test_update_connection_last_sync(mock_config_dir, sample_connection):
     datetime.fromisoformat(connections[0]["last_sync"])
 
 
+def test_connections_file_is_replaced_atomically(mock_config_dir, sample_connection):
+    """Test that saves are owner-only and leave no temporary file behind."""
+    save_truelayer_connection(sample_connection)
+    connections_file = mock_config_dir / "truelayer_connections.json"
+
+    assert connections_file.stat().st_mode & 0o777 == 0o600
+    assert not (mock_config_dir / "truelayer_connections.json.tmp").exists()
+
+    # A failed write keeps the previous contents instead of truncating them
+    with patch("expenses.data_handler.os.replace", side_effect=OSError("disk full")):
+        update_truelayer_connection({**sample_connection, "access_token": "new"})
+    assert load_truelayer_connections()[0]["access_token"] == "access_token_abc123"
+
+
 @patch("expenses.truelayer_handler._initialize_truelayer_session")
 def test_exchange_code_for_token_success(mock_session, mock_credentials):
     """Test successful code to token exchange."""
@@ -340,6 +360,46 @@ def test_convert_truelayer_transactions_to_dataframe(sample_transactions):
     assert df.iloc[2]["Type"] == "income"
 
 
+def test_convert_truelayer_transactions_keeps_local_day():
+    """Test that timestamps become datetime64 days in their own offset."""
+    transactions = [
+        {
+            "timestamp": "2024-01-15T23:30:00+02:00",
+            "description": "Late Dinner",
+            "amount": -30.00,
+        }
+    ]
+
+    df = convert_truelayer_transactions_to_dataframe(transactions, "Test Bank")
+
+    assert pd.api.types.is_datetime64_ns_dtype(df["Date"])
+    assert df.iloc[0]["Date"] == pd.Timestamp("2024-01-15")
+
+
+def test_convert_truelayer_transactions_mixed_offsets():
+    """Test that offsets changing between rows (e.g. at DST) still convert."""
+    transactions = [
+        {
+            "timestamp": "2024-03-30T23:30:00+00:00",
+            "description": "Before DST",
+            "amount": -10.00,
+        },
+        {
+            "timestamp": "2024-03-31T23:30:00+01:00",
+            "description": "After DST",
+            "amount": -20.00,
+            "running_balance": {"amount": 100.0, "currency": "GBP"},
+        },
+    ]
+
+    df = convert_truelayer_transactions_to_dataframe(transactions, "Test Bank")
+
+    assert df["Date"].tolist() == [
+        pd.Timestamp("2024-03-30"),
+        pd.Timestamp("2024-03-31"),
+    ]
+
+
 def test_convert_truelayer_transactions_empty():
     """Test conversion with empty transaction list."""
     df = convert_truelayer_transactions_to_dataframe([], "Test Bank")
@@ -16,7 +16,7 @@ class TestTrueLayerScreen(unittest.TestCase):
             ),
         ):
             screen = TrueLayerScreen()
-            assert screen.code_check_timer is None
+            assert screen.code_wait_worker is None
             assert screen.pending_transactions is None
             assert screen.pending_connection_id is None
             assert screen.pending_provider_name is None